@@ -5,14 +5,190 @@ Pre-built workflows for browser automation without AI
 """
 
 import asyncio
+import functools
+import re
+import weakref
+from pathlib import Path
 from typing import Dict, List, Optional, Any
+from urllib.parse import urlparse
 from playwright.async_api import Page
 
+# Resource types and analytics/ad domains that template pages never need;
+# aborting them cuts page.goto latency on third-party sites
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+BLOCK_DOMAINS = frozenset({
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'googlesyndication.com', 'facebook.net', 'hotjar.com', 'mixpanel.com',
+    'segment.io'
+})
+
+# Selector lists used by the templates, hoisted to module level so they are
+# built once instead of on every template call
+LOGIN_LINK_SELECTORS = (
+    'a:has-text("Sign in")', 'a:has-text("Login")', 'a:has-text("Log in")',
+    'a:has-text("Sign In")', 'a:has-text("Log In")',
+    'button:has-text("Sign in")', 'button:has-text("Login")', 'button:has-text("Log in")',
+    'a[href*="login"]', 'a[href*="signin"]', 'a[href*="auth"]'
+)
+
+SEARCH_PATTERNS = (
+    'input[name*="search"]', 'input[id*="search"]',
+    'input[placeholder*="search" i]', 'input[type="search"]',
+    'input[name="q"]', 'input[id="q"]'
+)
+
+POST_PATTERNS = (
+    'textarea[placeholder*="What\'s on your mind" i]',
+    'textarea[placeholder*="What\'s happening" i]',
+    'div[contenteditable="true"]',
+    'textarea[name*="post"]',
+    'textarea[id*="post"]'
+)
+
+EMAIL_PATTERNS = (
+    'input[type="email"]',
+    'input[name*="email"]',
+    'input[placeholder*="email" i]',
+    'input[id*="email"]'
+)
+
+TFA_PATTERNS = (
+    'input[name*="code"]', 'input[id*="code"]', 'input[placeholder*="code" i]',
+    'input[name*="otp"]', 'input[id*="otp"]', 'input[name*="token"]'
+)
+
+# Template catalog built once at import; get_available_templates hands out
+# shallow copies so UI callers polling it don't re-allocate the entries
+AVAILABLE_TEMPLATES = (
+    {'name': 'login', 'description': 'Login to websites', 'fields': ['username', 'password']},
+    {'name': 'job_application', 'description': 'Fill job application forms', 'fields': ['personal_info', 'resume_path']},
+    {'name': 'form_filling', 'description': 'Fill generic forms', 'fields': ['form_data']},
+    {'name': 'file_upload', 'description': 'Upload files', 'fields': ['files']},
+    {'name': 'search', 'description': 'Perform searches', 'fields': ['query']},
+    {'name': 'social_media_post', 'description': 'Post to social media', 'fields': ['content']},
+    {'name': 'contact_form', 'description': 'Fill contact forms', 'fields': ['name', 'email', 'message']},
+    {'name': 'newsletter_signup', 'description': 'Sign up for newsletters', 'fields': ['email']}
+)
+
+# Words that signal a successful or failed login in the page text or URL
+SUCCESS_INDICATORS = ('dashboard', 'profile', 'account', 'welcome', 'logout')
+FAILURE_INDICATORS = ('invalid', 'incorrect', 'error', 'failed', 'try again')
+
+# Runs the indicator scan inside the page so only a tiny verdict crosses the
+# CDP WebSocket instead of the full DOM from page.content()
+_LOGIN_VERDICT_JS = """
+([successWords, failureWords]) => {
+    const text = ((document.body && document.body.innerText) || '').toLowerCase();
+    const url = location.href.toLowerCase();
+    return {
+        success: successWords.some((w) => url.includes(w) || text.includes(w)),
+        failure: failureWords.some((w) => text.includes(w))
+    };
+}
+"""
+
+# Elements whose appearance signals a settled post-login page, so we can wait
+# on them instead of networkidle (which ads/analytics long-polls keep alive)
+POST_LOGIN_SELECTORS = (
+    'a[href*="logout"]', 'a[href*="signout"]',
+    '[data-testid*="dashboard"]',
+    '.error', '.alert-danger'
+)
+
+CONTACT_FIELD_PATTERNS = {
+    field: (
+        f'input[name*="{field}"]',
+        f'input[id*="{field}"]',
+        f'textarea[name*="{field}"]',
+        f'textarea[id*="{field}"]'
+    )
+    for field in ('name', 'email', 'subject', 'message')
+}
+
+# Playwright-only selectors like a:has-text("...") are not valid CSS, so they
+# are translated to {tag, text} descriptors the in-page probe can evaluate
+_HAS_TEXT_RE = re.compile(r'^(?P<tag>[\w*-]+):has-text\("(?P<text>[^"]+)"\)$')
+
+# Probes every selector in one evaluate call instead of one CDP round-trip
+# per wait_for_selector; returns the index of the first selector that matches
+_FIND_FIRST_JS = """
+(descs) => descs.findIndex((d) => {
+    if (d.css) {
+        try { return !!document.querySelector(d.css); } catch (e) { return false; }
+    }
+    const text = d.text.toLowerCase();
+    return Array.from(document.querySelectorAll(d.tag)).some(
+        (el) => (el.textContent || '').toLowerCase().includes(text)
+    );
+})
+"""
+
+# Same probe as above but resolves several selector groups at once, so a
+# whole form's worth of field lookups costs a single round-trip
+_FIND_FIRST_MAP_JS = """
+(groups) => {
+    const matches = (d) => {
+        if (d.css) {
+            try { return !!document.querySelector(d.css); } catch (e) { return false; }
+        }
+        const text = d.text.toLowerCase();
+        return Array.from(document.querySelectorAll(d.tag)).some(
+            (el) => (el.textContent || '').toLowerCase().includes(text)
+        );
+    };
+    const out = {};
+    for (const [key, descs] of Object.entries(groups)) {
+        out[key] = descs.findIndex(matches);
+    }
+    return out;
+}
+"""
+
+@functools.lru_cache(maxsize=None)
+def _selector_descriptors(selectors: tuple) -> List[Dict]:
+    """Translate a selector tuple into JS-evaluable descriptors (cached)"""
+    descriptors = []
+    for selector in selectors:
+        match = _HAS_TEXT_RE.match(selector)
+        if match:
+            descriptors.append({'tag': match.group('tag'), 'text': match.group('text')})
+        else:
+            descriptors.append({'css': selector})
+    return descriptors
+
+async def _first_matching_selector(page: Page, selectors: tuple) -> Optional[str]:
+    """Find the first matching selector with a single page.evaluate round-trip"""
+    try:
+        index = await page.evaluate(_FIND_FIRST_JS, _selector_descriptors(selectors))
+    except Exception:
+        return None
+    if index is None or index < 0:
+        return None
+    return selectors[index]
+
+async def _first_matching_selector_map(page: Page, selector_groups: Dict[str, tuple]) -> Dict[str, Optional[str]]:
+    """Resolve several selector groups with a single page.evaluate round-trip"""
+    payload = {key: _selector_descriptors(sels) for key, sels in selector_groups.items()}
+    try:
+        indexes = await page.evaluate(_FIND_FIRST_MAP_JS, payload)
+    except Exception:
+        return {key: None for key in selector_groups}
+    return {
+        key: (selector_groups[key][index] if index is not None and index >= 0 else None)
+        for key, index in indexes.items()
+    }
+
 class AutomationTemplates:
     """Pre-built automation templates for common tasks"""
 
-    def __init__(self, detector=None):
+    def __init__(self, detector=None, state_dir=None):
         self.detector = detector
+        # Directory for persisted storage states (cookies + localStorage);
+        # when set, successful logins are saved and later runs can skip the
+        # whole credential dance
+        self.state_dir = Path(state_dir) if state_dir else None
+        if self.state_dir:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
         self.templates = {
             'login': self.login_template,
             'job_application': self.job_application_template,
@@ -23,43 +199,82 @@ class AutomationTemplates:
             'contact_form': self.contact_form_template,
             'newsletter_signup': self.newsletter_signup_template
         }
-    
-    async def execute_template(self, template_name: str, page: Page, 
+        self._blocked_pages = weakref.WeakSet()
+
+    async def install_resource_blocker(self, page: Page) -> None:
+        """Abort images, fonts, media, and analytics requests on a page so
+        navigations only spend time on bytes the templates actually use"""
+        if page in self._blocked_pages:
+            return
+
+        async def _route_handler(route):
+            request = route.request
+            if (request.resource_type in BLOCKED_RESOURCE_TYPES
+                    or any(domain in request.url for domain in BLOCK_DOMAINS)):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await page.route('**/*', _route_handler)
+        self._blocked_pages.add(page)
+
+    async def execute_template(self, template_name: str, page: Page,
                              data: Dict, interactive_callback=None) -> Dict:
         """Execute a specific automation template"""
         if template_name not in self.templates:
             return {'success': False, 'error': f'Template {template_name} not found'}
-        
+
         try:
+            await self.install_resource_blocker(page)
             return await self.templates[template_name](page, data, interactive_callback)
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    async def _persist_storage_state(self, page: Page, result: Dict) -> None:
+        """Save cookies + localStorage so later runs can skip login entirely"""
+        if not self.state_dir:
+            return
+        try:
+            domain = urlparse(page.url).netloc or 'default'
+            state_path = self.state_dir / f"{domain}.json"
+            await page.context.storage_state(path=str(state_path))
+            result['steps'].append(f'Saved storage state: {state_path}')
+        except Exception as e:
+            result['steps'].append(f'Could not save storage state: {str(e)}')
+
     async def login_template(self, page: Page, data: Dict, callback=None) -> Dict:
         """Login automation template with comprehensive login handling"""
         result = {'success': False, 'steps': []}
 
+        # If a previously stored state already has us logged in (the caller
+        # opened the context with storage_state), skip the credential dance
+        try:
+            logout_probe = page.locator(
+                'a:has-text("Log out"), a:has-text("Sign out"), a[href*="logout"]'
+            ).first
+            if await logout_probe.is_visible(timeout=1000):
+                result['success'] = True
+                result['steps'].append('Already logged in via stored state')
+                return result
+        except Exception:
+            pass
+
         # First, try to find and click a "Sign In" or "Login" link if we're not on a login page
         current_url = page.url.lower()
         if 'login' not in current_url and 'signin' not in current_url and 'auth' not in current_url:
-            # Look for login/signin links first
-            login_link_selectors = [
-                'a:has-text("Sign in")', 'a:has-text("Login")', 'a:has-text("Log in")',
-                'a:has-text("Sign In")', 'a:has-text("Log In")',
-                'button:has-text("Sign in")', 'button:has-text("Login")', 'button:has-text("Log in")',
-                'a[href*="login"]', 'a[href*="signin"]', 'a[href*="auth"]'
-            ]
-
-            for selector in login_link_selectors:
+            # Probe all login/signin link selectors in one round-trip
+            selector = await _first_matching_selector(page, LOGIN_LINK_SELECTORS)
+            if selector:
+                await page.locator(selector).first.click()
+                # Wait for the login form itself rather than a fixed sleep:
+                # returns as soon as the page is ready, never races
                 try:
-                    element = await page.wait_for_selector(selector, timeout=3000, state='visible')
-                    if element:
-                        await element.click()
-                        await page.wait_for_timeout(2000)  # Wait for navigation
-                        result['steps'].append(f'Clicked login link: {selector}')
-                        break
-                except:
-                    continue
+                    await page.locator(
+                        'input[type="password"], input[type="email"], input[autocomplete="username"]'
+                    ).first.wait_for(state='visible', timeout=5000)
+                except Exception:
+                    await page.wait_for_load_state('domcontentloaded')
+                result['steps'].append(f'Clicked login link: {selector}')
 
         # Find login elements
         elements = await self.detector.find_login_elements(page)
@@ -77,18 +292,23 @@ class AutomationTemplates:
             await elements['username'].fill(data['username'])
             result['steps'].append('Username/email filled')
 
-            # Some sites require clicking "Next" after username
-            next_buttons = await self.detector.find_buttons_by_text(page, 'submit')
-            next_button = None
-            for btn in next_buttons:
-                btn_text = await btn.text_content() or ""
-                if 'next' in btn_text.lower():
-                    next_button = btn
-                    break
-
-            if next_button:
+            # Some sites require clicking "Next" after username; a single
+            # selector evaluation finds it instead of fetching text_content
+            # for every candidate button
+            next_button = page.locator(
+                'button:has-text("Next"), button:has-text("Continue"), '
+                '[role="button"]:has-text("Next"), input[type="submit"][value*="next" i]'
+            ).first
+            if await next_button.count():
                 await next_button.click()
-                await page.wait_for_timeout(2000)  # Wait for password field to appear
+                # Wait for the password field to actually appear instead of a
+                # fixed 2s sleep
+                try:
+                    await page.locator('input[type="password"]').first.wait_for(
+                        state='visible', timeout=5000
+                    )
+                except Exception:
+                    pass  # Some flows keep the password field on a later page
                 result['steps'].append('Clicked Next after username')
 
                 # Re-find password field after navigation
@@ -106,10 +326,8 @@ class AutomationTemplates:
             code = await callback("Please enter 2FA code:")
             if code and 'code' in code:
                 # Try to find 2FA input
-                tfa_input = await self.detector._find_element_by_patterns(page, [
-                    'input[name*="code"]', 'input[id*="code"]', 'input[placeholder*="code" i]',
-                    'input[name*="otp"]', 'input[id*="otp"]', 'input[name*="token"]'
-                ])
+                tfa_selector = await _first_matching_selector(page, TFA_PATTERNS)
+                tfa_input = page.locator(tfa_selector).first if tfa_selector else None
                 if tfa_input:
                     await tfa_input.fill(code['code'])
                     result['steps'].append('2FA code entered')
@@ -123,29 +341,30 @@ class AutomationTemplates:
             await elements['password'].press('Enter')
             result['steps'].append('Login submitted via Enter key')
 
-        # Wait for navigation or error
+        # Wait for navigation or error. networkidle is avoided on third-party
+        # pages: long-poll ads and analytics can keep it from ever firing, so
+        # wait for the DOM plus a concrete success/failure indicator instead
         try:
-            await page.wait_for_load_state('networkidle', timeout=15000)
-
-            # Check if login was successful by looking for common indicators
-            current_url = page.url
-            page_content = await page.content()
-
-            # Common success indicators
-            success_indicators = [
-                'dashboard', 'profile', 'account', 'welcome', 'logout'
-            ]
+            await page.wait_for_load_state('domcontentloaded', timeout=15000)
+            try:
+                await page.locator(', '.join(POST_LOGIN_SELECTORS)).first.wait_for(
+                    state='visible', timeout=5000
+                )
+            except Exception:
+                pass  # No indicator appeared; fall through to the content check
 
-            # Common failure indicators
-            failure_indicators = [
-                'invalid', 'incorrect', 'error', 'failed', 'try again'
-            ]
+            # Check if login was successful by scanning for common indicators
+            # inside the page — one small verdict instead of a full DOM download
+            verdict = await page.evaluate(
+                _LOGIN_VERDICT_JS,
+                [list(SUCCESS_INDICATORS), list(FAILURE_INDICATORS)]
+            )
 
-            if any(indicator in current_url.lower() or indicator in page_content.lower()
-                   for indicator in success_indicators):
+            if verdict['success']:
                 result['success'] = True
                 result['steps'].append('Login appears successful')
-            elif any(indicator in page_content.lower() for indicator in failure_indicators):
+                await self._persist_storage_state(page, result)
+            elif verdict['failure']:
                 result['success'] = False
                 result['steps'].append('Login appears to have failed')
             else:
@@ -176,27 +395,42 @@ class AutomationTemplates:
             'zip': data.get('zip_code')
         }
         
-        for field, value in personal_fields.items():
-            if elements.get(field) and value:
-                await elements[field].fill(str(value))
+        # The fields are independent, so fill them concurrently to pipeline
+        # the CDP messages instead of paying one round-trip per field
+        fill_items = [
+            (field, value) for field, value in personal_fields.items()
+            if elements.get(field) and value
+        ]
+        fill_results = await asyncio.gather(
+            *(elements[field].fill(str(value)) for field, value in fill_items),
+            return_exceptions=True
+        )
+        for (field, _), outcome in zip(fill_items, fill_results):
+            if isinstance(outcome, Exception):
+                result['steps'].append(f'Failed to fill {field}: {str(outcome)}')
+            else:
                 result['steps'].append(f'Filled {field}')
         
-        # Handle file uploads (resume, cover letter)
-        file_uploads = await self.detector.find_file_upload_elements(page)
-        if file_uploads and data.get('resume_path'):
-            # Try to identify which upload is for resume
-            for upload in file_uploads:
-                try:
-                    # Check if this looks like a resume upload
-                    upload_text = await upload.get_attribute('name') or ''
-                    upload_text += await upload.get_attribute('id') or ''
-                    
-                    if any(word in upload_text.lower() for word in ['resume', 'cv']):
-                        await upload.set_input_files(data['resume_path'])
-                        result['steps'].append('Resume uploaded')
-                        break
-                except:
-                    continue
+        # Handle file uploads (resume, cover letter). One evaluate_all
+        # round-trip returns every upload field's name/id instead of two
+        # get_attribute calls per element
+        if data.get('resume_path'):
+            uploads = page.locator('input[type="file"]')
+            try:
+                metas = await uploads.evaluate_all(
+                    "els => els.map(e => ({name: e.name || '', id: e.id || ''}))"
+                )
+                resume_index = next(
+                    (i for i, meta in enumerate(metas)
+                     if any(word in (meta['name'] + meta['id']).lower()
+                            for word in ('resume', 'cv'))),
+                    None
+                )
+                if resume_index is not None:
+                    await uploads.nth(resume_index).set_input_files(data['resume_path'])
+                    result['steps'].append('Resume uploaded')
+            except Exception:
+                pass
         
         # Interactive prompts for complex fields
         if callback:
@@ -217,19 +451,25 @@ class AutomationTemplates:
         # Get all form elements
         elements = await self.detector.find_form_elements(page)
         
-        # Fill all matching fields
+        # Fill all matching fields concurrently — each fill is an independent
+        # CDP round-trip, so gather pipelines them over the one WebSocket
+        fill_items = []
         for field_type, element in elements.items():
             if element and field_type in data:
-                try:
-                    value = data[field_type]
-                    if isinstance(value, str):
-                        await element.fill(value)
-                        result['steps'].append(f'Filled {field_type}')
-                    elif isinstance(value, list):  # For select options
-                        await element.select_option(value[0])
-                        result['steps'].append(f'Selected {field_type}')
-                except Exception as e:
-                    result['steps'].append(f'Failed to fill {field_type}: {str(e)}')
+                value = data[field_type]
+                if isinstance(value, str):
+                    fill_items.append((field_type, 'Filled', element.fill(value)))
+                elif isinstance(value, list):  # For select options
+                    fill_items.append((field_type, 'Selected', element.select_option(value[0])))
+
+        fill_results = await asyncio.gather(
+            *(coro for _, _, coro in fill_items), return_exceptions=True
+        )
+        for (field_type, verb, _), outcome in zip(fill_items, fill_results):
+            if isinstance(outcome, Exception):
+                result['steps'].append(f'Failed to fill {field_type}: {str(outcome)}')
+            else:
+                result['steps'].append(f'{verb} {field_type}')
         
         result['success'] = True
         return result
@@ -248,13 +488,19 @@ class AutomationTemplates:
         if isinstance(files_to_upload, str):
             files_to_upload = [files_to_upload]
         
-        for i, upload_element in enumerate(file_uploads):
-            if i < len(files_to_upload):
-                try:
-                    await upload_element.set_input_files(files_to_upload[i])
-                    result['steps'].append(f'Uploaded file: {files_to_upload[i]}')
-                except Exception as e:
-                    result['steps'].append(f'Failed to upload file: {str(e)}')
+        # The uploads target distinct elements, so run them concurrently —
+        # wall time becomes roughly the slowest upload instead of the sum
+        upload_pairs = list(zip(file_uploads, files_to_upload))
+        upload_results = await asyncio.gather(
+            *(upload_element.set_input_files(file_path)
+              for upload_element, file_path in upload_pairs),
+            return_exceptions=True
+        )
+        for (_, file_path), outcome in zip(upload_pairs, upload_results):
+            if isinstance(outcome, Exception):
+                result['steps'].append(f'Failed to upload file: {str(outcome)}')
+            else:
+                result['steps'].append(f'Uploaded file: {file_path}')
         
         result['success'] = True
         return result
@@ -268,14 +514,9 @@ class AutomationTemplates:
             result['error'] = 'No search query provided'
             return result
         
-        # Find search input
-        search_patterns = [
-            'input[name*="search"]', 'input[id*="search"]',
-            'input[placeholder*="search" i]', 'input[type="search"]',
-            'input[name="q"]', 'input[id="q"]'
-        ]
-        
-        search_input = await self.detector._find_element_by_patterns(page, search_patterns)
+        # Probe all search input selectors in one round-trip
+        search_selector = await _first_matching_selector(page, SEARCH_PATTERNS)
+        search_input = page.locator(search_selector).first if search_selector else None
         
         if search_input:
             await search_input.fill(search_query)
@@ -285,8 +526,9 @@ class AutomationTemplates:
             await search_input.press('Enter')
             result['steps'].append('Search submitted')
             
-            # Wait for results
-            await page.wait_for_load_state('networkidle', timeout=10000)
+            # Wait for the results DOM rather than networkidle, which
+            # third-party traffic can keep from ever firing
+            await page.wait_for_load_state('domcontentloaded', timeout=10000)
             result['success'] = True
         else:
             result['error'] = 'Search input not found'
@@ -302,16 +544,9 @@ class AutomationTemplates:
             result['error'] = 'No post content provided'
             return result
         
-        # Find post input (common patterns for social media)
-        post_patterns = [
-            'textarea[placeholder*="What\'s on your mind" i]',
-            'textarea[placeholder*="What\'s happening" i]',
-            'div[contenteditable="true"]',
-            'textarea[name*="post"]',
-            'textarea[id*="post"]'
-        ]
-        
-        post_input = await self.detector._find_element_by_patterns(page, post_patterns)
+        # Probe all post input selectors in one round-trip
+        post_selector = await _first_matching_selector(page, POST_PATTERNS)
+        post_input = page.locator(post_selector).first if post_selector else None
         
         if post_input:
             await post_input.fill(post_content)
@@ -340,20 +575,24 @@ class AutomationTemplates:
             'message': data.get('message')
         }
         
-        # Find and fill contact form fields
-        for field, value in contact_fields.items():
-            if value:
-                patterns = [
-                    f'input[name*="{field}"]',
-                    f'input[id*="{field}"]',
-                    f'textarea[name*="{field}"]',
-                    f'textarea[id*="{field}"]'
-                ]
-                
-                element = await self.detector._find_element_by_patterns(page, patterns)
-                if element:
-                    await element.fill(str(value))
-                    result['steps'].append(f'Filled {field}')
+        # Resolve every field's selector in one round-trip, then fill the
+        # matched fields concurrently
+        fields_to_fill = {field: value for field, value in contact_fields.items() if value}
+        selector_map = await _first_matching_selector_map(
+            page, {field: CONTACT_FIELD_PATTERNS[field] for field in fields_to_fill}
+        )
+
+        matched_fields = [field for field in fields_to_fill if selector_map[field]]
+        fill_results = await asyncio.gather(
+            *(page.locator(selector_map[field]).first.fill(str(fields_to_fill[field]))
+              for field in matched_fields),
+            return_exceptions=True
+        )
+        for field, outcome in zip(matched_fields, fill_results):
+            if isinstance(outcome, Exception):
+                result['steps'].append(f'Failed to fill {field}: {str(outcome)}')
+            else:
+                result['steps'].append(f'Filled {field}')
         
         result['success'] = True
         return result
@@ -367,15 +606,9 @@ class AutomationTemplates:
             result['error'] = 'No email provided'
             return result
         
-        # Find email input for newsletter
-        email_patterns = [
-            'input[type="email"]',
-            'input[name*="email"]',
-            'input[placeholder*="email" i]',
-            'input[id*="email"]'
-        ]
-        
-        email_input = await self.detector._find_element_by_patterns(page, email_patterns)
+        # Probe all email input selectors in one round-trip
+        email_selector = await _first_matching_selector(page, EMAIL_PATTERNS)
+        email_input = page.locator(email_selector).first if email_selector else None
         
         if email_input:
             await email_input.fill(email)
@@ -394,13 +627,4 @@ class AutomationTemplates:
     
     def get_available_templates(self) -> List[Dict]:
         """Get list of available automation templates"""
-        return [
-            {'name': 'login', 'description': 'Login to websites', 'fields': ['username', 'password']},
-            {'name': 'job_application', 'description': 'Fill job application forms', 'fields': ['personal_info', 'resume_path']},
-            {'name': 'form_filling', 'description': 'Fill generic forms', 'fields': ['form_data']},
-            {'name': 'file_upload', 'description': 'Upload files', 'fields': ['files']},
-            {'name': 'search', 'description': 'Perform searches', 'fields': ['query']},
-            {'name': 'social_media_post', 'description': 'Post to social media', 'fields': ['content']},
-            {'name': 'contact_form', 'description': 'Fill contact forms', 'fields': ['name', 'email', 'message']},
-            {'name': 'newsletter_signup', 'description': 'Sign up for newsletters', 'fields': ['email']}
-        ]
+        return list(AVAILABLE_TEMPLATES)
@@ -5,9 +5,20 @@ Requires Ollama to be installed and running locally
 """
 
 import asyncio
+import functools
 from langchain_ollama import ChatOllama
 from browser_use import Agent
 
+@functools.lru_cache(maxsize=None)
+def get_llm(model: str = "qwen2.5:7b", num_ctx: int = 32000) -> ChatOllama:
+    """Return a cached ChatOllama client so repeated runs reuse the same
+    client and its keepalive HTTP connections instead of reconnecting"""
+    return ChatOllama(
+        model=model,         # or any other model you have pulled
+        num_ctx=num_ctx,     # context window
+        temperature=0.1
+    )
+
 async def browser_automation_with_local_llm():
     """
     Example using browser-use with local Ollama LLM
@@ -18,16 +29,12 @@ async def browser_automation_with_local_llm():
     3. Install dependencies: pip install langchain-ollama browser-use
     """
     
-    # Initialize local LLM (no API key needed)
-    llm = ChatOllama(
-        model="qwen2.5:7b",  # or any other model you have pulled
-        num_ctx=32000,       # context window
-        temperature=0.1
-    )
-    
-    # Test LLM connection
+    # Initialize local LLM (no API key needed); cached across runs
+    llm = get_llm()
+
+    # Test LLM connection without blocking the event loop
     try:
-        response = llm.invoke("Hello, can you help with browser automation?")
+        response = await llm.ainvoke("Hello, can you help with browser automation?")
         print(f"LLM Response: {response.content}")
     except Exception as e:
         print(f"Error connecting to Ollama: {e}")
@@ -5,6 +5,7 @@ Demonstrates interactive prompting, file attachments, and auto-positioning
 """
 
 import asyncio
+import functools
 import os
 import sys
 from pathlib import Path
@@ -20,14 +21,26 @@ except ImportError as e:
     print("Please ensure enhanced-browser-interface.py is in the same directory")
     sys.exit(1)
 
+from demo_support import get_shared_browser, get_cdp_url, shutdown_shared_browser
+
+async def _with_browser_cleanup(coro):
+    """Run a demo coroutine, then close the shared browser while the loop
+    that owns it is still alive; it can't be closed from another loop"""
+    try:
+        await coro
+    finally:
+        await shutdown_shared_browser()
+
 async def demo_interactive_automation():
     """Demo interactive automation with prompting"""
     print("🎯 Demo: Interactive Browser Automation")
     print("=" * 50)
     
-    # Initialize the enhanced interface
-    interface = EnhancedBrowserInterface()
-    
+    # Launch the shared browser once; the interface connects to it over CDP
+    # instead of paying a full Chromium launch per demo
+    await get_shared_browser()
+    interface = EnhancedBrowserInterface(cdp_url=get_cdp_url())
+
     if not interface.llm:
         print("❌ No Anthropic API key configured. Please set ANTHROPIC_API_KEY environment variable.")
         return
@@ -146,7 +159,7 @@ def demo_window_management():
     print("🔄 Attempting to bring browser window to front and center...")
     
     try:
-        WindowManager.bring_to_front_and_center()
+        asyncio.run(WindowManager.bring_to_front_and_center())
         print("✅ Window management command executed")
         print("💡 If a browser window was open, it should now be in front and centered")
     except Exception as e:
@@ -177,6 +190,23 @@ def demo_enhanced_commands():
     print("   • Position browser window for optimal viewing")
     print("   • Provide real-time feedback and screenshots")
 
+async def _run_demo_jobs(jobs):
+    """Run demo jobs with an LPT scheduler: longest estimated job first,
+    pulled from a priority queue by a small worker pool so independent
+    demos overlap instead of running strictly back-to-back"""
+    job_queue = asyncio.PriorityQueue()
+    for order, (estimated_s, job) in enumerate(jobs):
+        # Negative cost so the longest job is scheduled first; the
+        # submission order breaks ties
+        job_queue.put_nowait((-estimated_s, order, job))
+
+    async def worker():
+        while not job_queue.empty():
+            _, _, job = job_queue.get_nowait()
+            await job()
+
+    await asyncio.gather(*(worker() for _ in range(min(5, len(jobs)))))
+
 def main():
     """Run all demos"""
     print("🤖 Enhanced Browser Automation - Feature Demos")
@@ -197,23 +227,38 @@ def main():
     print()
     
     choice = input("Enter demo number (1-4) or 'all' for all demos: ").strip()
-    
-    if choice == "1" or choice.lower() == "all":
+
+    if choice.lower() == "all":
+        # Run every demo through the LPT scheduler; sync demos are pushed
+        # to threads so the workers can actually overlap them
+        jobs = [
+            (30, functools.partial(asyncio.to_thread, demo_file_management)),
+            (5, functools.partial(asyncio.to_thread, demo_window_management)),
+            (5, functools.partial(asyncio.to_thread, demo_enhanced_commands)),
+        ]
+        if os.getenv("ANTHROPIC_API_KEY"):
+            print("🚀 Starting interactive automation demo...")
+            jobs.append((120, demo_interactive_automation))
+        else:
+            print("❌ Cannot run interactive demo without API key")
+        asyncio.run(_with_browser_cleanup(_run_demo_jobs(jobs)))
+
+    if choice == "1":
         demo_file_management()
         print()
-    
-    if choice == "2" or choice.lower() == "all":
+
+    if choice == "2":
         demo_window_management()
         print()
-    
-    if choice == "3" or choice.lower() == "all":
+
+    if choice == "3":
         demo_enhanced_commands()
         print()
-    
-    if choice == "4" or choice.lower() == "all":
+
+    if choice == "4":
         if os.getenv("ANTHROPIC_API_KEY"):
             print("🚀 Starting interactive automation demo...")
-            asyncio.run(demo_interactive_automation())
+            asyncio.run(_with_browser_cleanup(demo_interactive_automation()))
         else:
             print("❌ Cannot run interactive demo without API key")
     
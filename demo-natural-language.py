@@ -15,9 +15,14 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import importlib.util
 
 def load_module(module_name, file_path):
-    """Load a module from a file path"""
+    """Load a module from a file path, cached in sys.modules so repeated
+    loads in the same process don't re-parse and re-execute the source"""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
     spec = importlib.util.spec_from_file_location(module_name, file_path)
     module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
     spec.loader.exec_module(module)
     return module
 
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Shared Browser Support for Demo Scripts
+Launches a single Chromium instance and publishes its CDP endpoint so every
+demo connects to the same browser instead of paying a fresh launch per run
+"""
+
+from playwright.async_api import async_playwright
+
+CDP_PORT = 9222
+CDP_URL = f"http://localhost:{CDP_PORT}"
+
+_playwright = None
+_browser = None
+
+async def get_shared_browser(headless: bool = False):
+    """Launch (at most once) and return the shared Chromium instance"""
+    global _playwright, _browser
+
+    if _browser is None:
+        _playwright = await async_playwright().start()
+        _browser = await _playwright.chromium.launch(
+            headless=headless,
+            args=[f"--remote-debugging-port={CDP_PORT}"]
+        )
+
+    return _browser
+
+async def get_shared_context():
+    """Return an isolated context on the shared browser (a few MB each,
+    versus hundreds of MB for a whole new browser process)"""
+    browser = await get_shared_browser()
+    return await browser.new_context()
+
+def get_cdp_url() -> str:
+    """CDP endpoint that demos and browser-use agents can connect to"""
+    return CDP_URL
+
+async def shutdown_shared_browser():
+    """Close the shared browser and stop Playwright. Must run on the loop
+    that created the browser - the demo runner awaits this at the end of
+    its asyncio.run scope, since the connection is unusable from any
+    other (or later) loop"""
+    global _playwright, _browser
+
+    if _browser is not None:
+        await _browser.close()
+        _browser = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
@@ -6,29 +6,51 @@ Advanced browser automation with real-time user interaction and context manageme
 
 import asyncio
 import gradio as gr
+import hashlib
 import os
+import re
 import sys
 import json
 import time
 import threading
-import queue
-import subprocess
+import itertools
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 import platform
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 import tempfile
 import shutil
 
-# File parsing imports
+# File parsing libraries (PyPDF2, python-docx, Pillow, pytesseract,
+# pypdfium2) are imported lazily inside their extractors so interpreter
+# startup never pays for file types that are never uploaded
+
+# Optional async file I/O for screenshot writes
 try:
-    import PyPDF2
-    import docx
-    from PIL import Image
-    import pytesseract
-    FILE_PARSING_AVAILABLE = True
+    import aiofiles
+    AIOFILES_AVAILABLE = True
 except ImportError:
-    print("⚠️  Some file parsing libraries not available. Install with: pip install PyPDF2 python-docx pillow pytesseract")
-    FILE_PARSING_AVAILABLE = False
+    AIOFILES_AVAILABLE = False
+
+# Optional fast JSON for the payloads Gradio re-serializes on every refresh
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# History entries keep at most this much of each result so the list stays
+# cheap to re-send to the UI on every refresh
+_MAX_HISTORY_RESULT_CHARS = 4096
+
+def _to_plain_json(obj):
+    """Round-trip a payload into plain JSON types before Gradio serializes
+    it; orjson dumps tens-of-KB session/history blobs 2-5x faster than the
+    stdlib, which stays as the fallback"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(orjson.dumps(obj, default=str))
+    return json.loads(json.dumps(obj, default=str))
 
 # Browser-use imports
 try:
@@ -40,196 +62,508 @@ except ImportError as e:
     print("Please ensure browser-use is installed: pip install browser-use")
     sys.exit(1)
 
+# KEY=value lines in .env files, skipping comments; compiled once
+_ENV_LINE_RE = re.compile(r'(?m)^(?!\s*#)\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$')
+
+# Prompt wrapper for interactive commands; built once at import and filled
+# in with a single .format() per invocation
+_ENHANCED_TEMPLATE = """
+{command}
+
+{file_context}
+
+INTERACTIVE AUTOMATION INSTRUCTIONS:
+1. You can request user input during execution by saying "REQUEST_USER_INPUT: [your question]"
+2. If you need clarification or direction, pause and ask the user
+3. Use uploaded file context when relevant (resumes, cover letters, etc.)
+4. For complex workflows, break them into steps and confirm with user
+5. If credentials provided: username="{username}", password="{password}"
+6. Take screenshots at key decision points
+7. Handle authentication and multi-step processes carefully
+8. If you encounter unexpected situations, ask for user guidance
+
+SPECIAL FILE REFERENCES:
+- When user mentions "my resume" or "resume", refer to uploaded resume files
+- When user mentions "cover letter", refer to uploaded cover letter files
+- Use file content to fill forms or provide context-appropriate responses
+
+Execute this command with interactive capabilities and comprehensive feedback.
+"""
+
+# Long-lived Tesseract engine, one per (worker) process, so the ~15MB LSTM
+# model loads once instead of once per image via pytesseract's subprocess
+_TESS_API = None
+
+def _get_tess_api():
+    global _TESS_API
+    if _TESS_API is None:
+        import tesserocr
+        _TESS_API = tesserocr.PyTessBaseAPI(
+            psm=tesserocr.PSM.SINGLE_BLOCK, oem=tesserocr.OEM.LSTM_ONLY
+        )
+    return _TESS_API
+
+def _ocr_image_worker(path_str: str) -> str:
+    """Top-level OCR worker so ProcessPoolExecutor can pickle it; runs the
+    same preprocessing pipeline FileManager uses for images"""
+    from PIL import Image, ImageOps
+
+    image = Image.open(path_str).convert("L")
+    if max(image.size) > 2000:
+        image.thumbnail((2000, 2000), Image.LANCZOS)
+    image = ImageOps.autocontrast(image)
+    image = image.point(lambda p: 255 if p > 140 else 0)
+
+    try:
+        api = _get_tess_api()
+        api.SetImage(image)
+        return api.GetUTF8Text().strip()
+    except Exception:
+        # tesserocr missing or engine init failed; one subprocess per image
+        import pytesseract
+        return pytesseract.image_to_string(image, config='--oem 1 --psm 6').strip()
+
 class InteractivePromptManager:
     """Manages interactive prompts during browser automation"""
-    
+
     def __init__(self):
-        self.prompt_queue = queue.Queue()
-        self.response_queue = queue.Queue()
+        self.prompt_queue = asyncio.Queue()
+        self.response_queue = asyncio.Queue()
         self.is_waiting = False
         self.current_prompt = None
-    
-    def request_user_input(self, prompt_text: str, options: List[str] = None) -> str:
-        """Request input from user during automation"""
+        self._loop = None
+
+    def bind_loop(self, loop=None):
+        """Remember the event loop the automation runs on so the sync Gradio
+        callback can hand responses across threads safely"""
+        self._loop = loop or asyncio.get_running_loop()
+
+    async def request_user_input(self, prompt_text: str, options: List[str] = None) -> str:
+        """Request input from user during automation without blocking the
+        event loop while waiting"""
+        self.bind_loop()
         self.current_prompt = {
             "text": prompt_text,
             "options": options or [],
             "timestamp": time.time()
         }
         self.is_waiting = True
-        self.prompt_queue.put(self.current_prompt)
-        
+        self.prompt_queue.put_nowait(self.current_prompt)
+
         # Wait for response
         try:
-            response = self.response_queue.get(timeout=300)  # 5 minute timeout
-            self.is_waiting = False
-            self.current_prompt = None
-            return response
-        except queue.Empty:
+            return await asyncio.wait_for(self.response_queue.get(), timeout=300)  # 5 minute timeout
+        except asyncio.TimeoutError:
+            return "timeout"
+        finally:
             self.is_waiting = False
             self.current_prompt = None
-            return "timeout"
-    
+
     def provide_response(self, response: str):
-        """Provide response to waiting automation"""
-        if self.is_waiting:
-            self.response_queue.put(response)
-    
+        """Provide response to waiting automation (safe to call from the
+        Gradio thread)"""
+        if not self.is_waiting:
+            return
+        if self._loop and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self.response_queue.put_nowait, response)
+        else:
+            self.response_queue.put_nowait(response)
+
     def get_current_prompt(self):
         """Get current prompt if any"""
         return self.current_prompt if self.is_waiting else None
 
 class FileManager:
     """Manages uploaded files and context extraction"""
-    
+
+    # Bound on retained files; the oldest entry (and its on-disk copy) is
+    # evicted when the cap is hit so long sessions don't grow RSS forever
+    MAX_FILES = 50
+    # Bound on the persisted extraction cache, LRU like the files above:
+    # without it the index kept every extraction ever made and the JSON
+    # dump grew (and slowed) forever
+    MAX_CACHE_ENTRIES = 200
+
     def __init__(self):
         self.upload_dir = Path(tempfile.gettempdir()) / "browser_automation_files"
         self.upload_dir.mkdir(exist_ok=True)
-        self.files = {}
-    
+        self.files = OrderedDict()
+        # Per-file formatted context blocks plus the aggregated string, so
+        # repeated agent turns don't re-read and re-concatenate every file
+        self._context_blocks = {}
+        self._context_cache = None
+        # Monotonic id counter; safe when saves run on worker threads
+        self._file_counter = itertools.count()
+        # Guards files/context/cache-index state when concurrent uploads
+        # run save_file on worker threads
+        self._files_lock = threading.Lock()
+        # Content-addressed extraction cache: re-uploading the same resume
+        # skips the PDF/DOCX/OCR pass entirely. Persisted across sessions
+        self._cache_index_path = self.upload_dir / ".cache_index.json"
+        try:
+            self._cache_index = OrderedDict(
+                json.loads(self._cache_index_path.read_text(encoding="utf-8"))
+            )
+        except Exception:
+            self._cache_index = OrderedDict()
+        # Lazily created pool for CPU-bound extraction work (OCR)
+        self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Lazily create the shared process pool for CPU-bound extraction"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+        return self._pool
+
+    async def save_file_async(self, file_path: str, original_name: str) -> str:
+        """Async wrapper around save_file: the blocking copy and PDF/OCR
+        extraction run on a worker thread so multiple uploads overlap"""
+        return await asyncio.to_thread(self.save_file, file_path, original_name)
+
     def save_file(self, file_path: str, original_name: str) -> str:
         """Save uploaded file and extract content"""
-        file_id = f"file_{int(time.time())}_{len(self.files)}"
+        file_id = f"file_{int(time.time())}_{next(self._file_counter)}"
         saved_path = self.upload_dir / f"{file_id}_{original_name}"
-        
-        # Copy file to managed location
-        shutil.copy2(file_path, saved_path)
-        
-        # Extract content
-        content = self._extract_content(saved_path)
-        
-        self.files[file_id] = {
-            "id": file_id,
-            "original_name": original_name,
-            "path": str(saved_path),
-            "content": content,
-            "upload_time": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "size": saved_path.stat().st_size
-        }
-        
+
+        # Copy file to managed location, hashing as it streams so the
+        # content is read once instead of copy-then-rehash
+        file_hash, size = self._copy_and_hash(Path(file_path), saved_path)
+
+        # Extract content, reusing the cached text when this exact content
+        # has been processed before
+        cache_key = f"{file_hash}:{size}"
+        with self._files_lock:
+            cached = self._cache_index.get(cache_key)
+            if cached is not None:
+                self._cache_index.move_to_end(cache_key)
+        if cached is not None:
+            content = cached["content"]
+        else:
+            # Extraction stays outside the lock - it's the slow part and
+            # touches no shared state
+            content = self._extract_content(saved_path)
+            with self._files_lock:
+                self._cache_index[cache_key] = {
+                    "content": content,
+                    "original_name": original_name
+                }
+                while len(self._cache_index) > self.MAX_CACHE_ENTRIES:
+                    self._cache_index.popitem(last=False)
+                # Snapshot under the lock; the (slow) disk write happens
+                # outside it so concurrent uploads aren't serialized on I/O
+                snapshot = json.dumps(self._cache_index)
+            self._write_cache_index(snapshot)
+
+        with self._files_lock:
+            # Evict least-recently-used files beyond the cap, including
+            # their on-disk copies and context blocks
+            while len(self.files) >= self.MAX_FILES:
+                old_id, old_info = self.files.popitem(last=False)
+                self._context_blocks.pop(old_id, None)
+                try:
+                    Path(old_info["path"]).unlink()
+                except OSError:
+                    pass
+                self._context_cache = None
+
+            self.files[file_id] = {
+                "id": file_id,
+                "original_name": original_name,
+                "path": str(saved_path),
+                "content": content,
+                "upload_time": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "size": size
+            }
+
+            # Precompute this file's context block and invalidate the
+            # aggregate
+            block = f"\n--- {original_name} ---\n"
+            block += content[:2000]  # Limit content length
+            if len(content) > 2000:
+                block += "\n... (content truncated)"
+            block += "\n"
+            self._context_blocks[file_id] = block
+            self._context_cache = None
+
         return file_id
-    
+
+    def _copy_and_hash(self, src_path: Path, dst_path: Path) -> tuple:
+        """Copy a file in 64KB chunks while feeding the MD5 digest, so one
+        read pass serves both the copy and the cache key"""
+        file_hash = hashlib.md5()
+        size = 0
+        with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+            while chunk := src.read(1 << 16):
+                file_hash.update(chunk)
+                dst.write(chunk)
+                size += len(chunk)
+        shutil.copystat(src_path, dst_path)
+        return file_hash.hexdigest(), size
+
+    def _write_cache_index(self, payload: str):
+        """Persist a cache snapshot so later sessions benefit too. Runs
+        outside _files_lock; the temp-file-plus-rename keeps the index
+        intact even when two saves race - the last complete snapshot wins,
+        never an interleaved half-write"""
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.upload_dir, prefix=".cache_index.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._cache_index_path)
+        except Exception as e:
+            print(f"Cache index warning: {e}")
+
     def _extract_content(self, file_path: Path) -> str:
-        """Extract text content from various file types"""
+        """Extract text content from various file types via dict dispatch"""
         try:
             suffix = file_path.suffix.lower()
-            
-            if suffix == '.pdf':
-                return self._extract_pdf_content(file_path)
-            elif suffix in ['.docx', '.doc']:
-                return self._extract_docx_content(file_path)
-            elif suffix in ['.txt', '.md', '.py', '.js', '.html', '.css']:
-                return file_path.read_text(encoding='utf-8', errors='ignore')
-            elif suffix in ['.png', '.jpg', '.jpeg', '.gif', '.bmp']:
-                return self._extract_image_text(file_path)
-            else:
+            handler = self._EXTRACTORS.get(suffix)
+            if handler is None:
                 return f"File type {suffix} not supported for content extraction"
-                
+            return handler(self, file_path)
+
         except Exception as e:
             return f"Error extracting content: {str(e)}"
+
+    def _read_text_content(self, file_path: Path) -> str:
+        """Read plain-text style files directly"""
+        return file_path.read_text(encoding='utf-8', errors='ignore')
     
-    def _extract_pdf_content(self, file_path: Path) -> str:
-        """Extract text from PDF"""
-        if not FILE_PARSING_AVAILABLE:
+    # Keep roughly double the 2000-char context budget so previews and
+    # truncation markers still work, without extracting unused pages
+    MAX_EXTRACT_CHARS = 4096
+
+    def _extract_pdf_content(self, file_path: Path, max_chars: int = MAX_EXTRACT_CHARS) -> str:
+        """Extract text from PDF, stopping as soon as the downstream context
+        budget is covered instead of parsing every page"""
+        # PDFium is the fast native backend; PyPDF2 stays as the fallback.
+        # After the first load these imports are just sys.modules lookups
+        try:
+            import pypdfium2 as pdfium
+        except ImportError:
+            pdfium = None
+
+        if pdfium is not None:
+            try:
+                pdf = pdfium.PdfDocument(str(file_path))
+                try:
+                    parts = []
+                    total_len = 0
+                    for page in pdf:
+                        textpage = page.get_textpage()
+                        page_text = textpage.get_text_range()
+                        textpage.close()
+                        page.close()
+                        if page_text:
+                            parts.append(page_text)
+                            total_len += len(page_text) + 1
+                        if total_len >= max_chars:
+                            break
+                    return "\n".join(parts)[:max_chars].strip()
+                finally:
+                    pdf.close()
+            except Exception:
+                pass  # Fall back to the PyPDF2 path below
+
+        try:
+            import PyPDF2
+        except ImportError:
             return "PDF parsing not available - install PyPDF2"
         try:
             with open(file_path, 'rb') as file:
                 reader = PyPDF2.PdfReader(file)
-                text = ""
+                parts = []
+                total_len = 0
                 for page in reader.pages:
-                    text += page.extract_text() + "\n"
-                return text.strip()
+                    page_text = page.extract_text()
+                    if page_text:
+                        parts.append(page_text)
+                        total_len += len(page_text) + 1
+                    if total_len >= max_chars:
+                        break
+                return "\n".join(parts)[:max_chars].strip()
         except:
             return "Could not extract PDF content"
 
     def _extract_docx_content(self, file_path: Path) -> str:
         """Extract text from Word document"""
-        if not FILE_PARSING_AVAILABLE:
+        try:
+            import docx
+        except ImportError:
             return "Word document parsing not available - install python-docx"
         try:
             doc = docx.Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            # join instead of str += per paragraph, which is O(n^2)
+            return "\n".join(p.text for p in doc.paragraphs).strip()
         except:
             return "Could not extract Word document content"
 
     def _extract_image_text(self, file_path: Path) -> str:
         """Extract text from image using OCR"""
-        if not FILE_PARSING_AVAILABLE:
+        try:
+            from PIL import Image  # noqa: F401 - probe OCR deps before dispatch
+        except ImportError:
             return "Image OCR not available - install pillow and pytesseract"
         try:
-            image = Image.open(file_path)
-            text = pytesseract.image_to_string(image)
-            return text.strip()
+            # OCR (preprocess + Tesseract) is CPU-bound, so run it in the
+            # process pool — concurrent uploads then use multiple cores
+            # instead of serializing on the GIL
+            try:
+                return self._get_pool().submit(_ocr_image_worker, str(file_path)).result()
+            except Exception:
+                # Pool unavailable; run the same pipeline inline
+                return _ocr_image_worker(str(file_path))
         except:
             return "Could not extract text from image"
-    
+
+    # Suffix -> handler dispatch table, built once at class creation
+    _EXTRACTORS = {
+        '.pdf': _extract_pdf_content,
+        '.docx': _extract_docx_content,
+        '.doc': _extract_docx_content,
+        '.txt': _read_text_content,
+        '.md': _read_text_content,
+        '.py': _read_text_content,
+        '.js': _read_text_content,
+        '.html': _read_text_content,
+        '.css': _read_text_content,
+        '.png': _extract_image_text,
+        '.jpg': _extract_image_text,
+        '.jpeg': _extract_image_text,
+        '.gif': _extract_image_text,
+        '.bmp': _extract_image_text
+    }
+
     def get_file_content(self, file_id: str) -> str:
-        """Get content of a specific file"""
-        return self.files.get(file_id, {}).get("content", "")
+        """Get content of a specific file, refreshing its LRU position"""
+        file_info = self.files.get(file_id)
+        if file_info is None:
+            return ""
+        self.files.move_to_end(file_id)
+        return file_info.get("content", "")
     
     def get_all_files_context(self) -> str:
-        """Get context from all uploaded files"""
+        """Get context from all uploaded files (cached until files change)"""
         if not self.files:
             return ""
-        
-        context = "UPLOADED FILES CONTEXT:\n"
-        for file_info in self.files.values():
-            context += f"\n--- {file_info['original_name']} ---\n"
-            context += file_info['content'][:2000]  # Limit content length
-            if len(file_info['content']) > 2000:
-                context += "\n... (content truncated)"
-            context += "\n"
-        
-        return context
+
+        if self._context_cache is None:
+            self._context_cache = "UPLOADED FILES CONTEXT:\n" + "".join(
+                self._context_blocks[file_id] for file_id in self.files
+            )
+
+        return self._context_cache
     
     def list_files(self) -> List[Dict]:
-        """List all uploaded files"""
-        return list(self.files.values())
+        """List uploaded file metadata. Sizes come from the stat captured at
+        save time and content is truncated to a preview — callers that need
+        the full text use get_file_content"""
+        return [
+            {
+                "id": info["id"],
+                "original_name": info["original_name"],
+                "path": info["path"],
+                "content": info["content"][:200],
+                "upload_time": info["upload_time"],
+                "size": info["size"]
+            }
+            for info in self.files.values()
+        ]
 
 class WindowManager:
     """Manages browser window positioning and focusing"""
     
     @staticmethod
-    def bring_to_front_and_center():
-        """Bring browser window to front and center it"""
+    async def bring_to_front_and_center():
+        """Bring browser window to front and center it; spawned without
+        blocking the event loop the automation runs on"""
         try:
             system = platform.system()
-            
+
             if system == "Linux":
-                # Use wmctrl if available
-                subprocess.run(["wmctrl", "-a", "Chrome"], check=False)
-                subprocess.run(["wmctrl", "-a", "Chromium"], check=False)
+                # One xdotool search matches Chrome and Chromium in a single
+                # fork instead of two back-to-back wmctrl calls
+                try:
+                    proc = await asyncio.create_subprocess_exec(
+                        "xdotool", "search", "--name", "Chrom(e|ium)", "windowactivate",
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.DEVNULL
+                    )
+                except FileNotFoundError:
+                    # xdotool missing; fall back to wmctrl's substring match
+                    proc = await asyncio.create_subprocess_exec(
+                        "wmctrl", "-a", "Chrom",
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.DEVNULL
+                    )
+                await proc.wait()
             elif system == "Darwin":  # macOS
-                subprocess.run([
+                proc = await asyncio.create_subprocess_exec(
                     "osascript", "-e",
-                    'tell application "Google Chrome" to activate'
-                ], check=False)
+                    'tell application "Google Chrome" to activate',
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+                await proc.wait()
             elif system == "Windows":
                 # Windows-specific window management would go here
                 pass
-                
+
         except Exception as e:
             print(f"Window management warning: {e}")
 
 class EnhancedBrowserInterface:
     """Enhanced browser interface with interactive prompting and file attachments"""
     
-    def __init__(self):
+    def __init__(self, cdp_url: Optional[str] = None):
+        # When a CDP endpoint is provided (or CHROME_CDP is set), agents
+        # connect to that already-running Chromium instead of launching a
+        # fresh browser per command
+        self.cdp_url = cdp_url or os.getenv("CHROME_CDP")
+        # Shared browser handle, launched lazily on first command and then
+        # reused; a Chromium launch costs seconds and dwarfs most automations
+        self._browser = None
+        self._browser_playwright = None
+        self._browser_lock = asyncio.Lock()
+        # Fixed ring of screenshot slots reused round-robin, so a long
+        # session overwrites hot files in place instead of leaking a new
+        # PNG into /tmp per command
+        self._ss_ring = [
+            Path(tempfile.gettempdir()) / f"browser_ss_{i}.png" for i in range(4)
+        ]
+        self._ss_idx = 0
         self.llm = self.setup_anthropic()
         self.prompt_manager = InteractivePromptManager()
         self.file_manager = FileManager()
         self.session_data = {
             "credentials": {},
-            "conversation_history": [],
+            # Bounded so a long-lived session can't grow without limit
+            "conversation_history": deque(maxlen=200),
             "current_url": "",
             "last_screenshot": None,
             "execution_state": "idle"
         }
         self.load_env_vars()
-    
+        # One long-lived event loop on a worker thread. Creating and closing
+        # a loop per UI click tore down the Agent's HTTP connection pools and
+        # Playwright transport every time; this keeps them warm
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._run_loop, name="automation-loop", daemon=True
+        )
+        self._loop_thread.start()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def run_async(self, coro, timeout=None):
+        """Run a coroutine on the persistent automation loop and wait"""
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return future.result(timeout)
+
     def load_env_vars(self):
         """Load environment variables from .env files"""
         env_files = [
@@ -239,11 +573,11 @@ class EnhancedBrowserInterface:
         
         for env_file in env_files:
             if env_file.exists():
-                with open(env_file) as f:
-                    for line in f:
-                        if line.strip() and not line.startswith("#") and "=" in line:
-                            key, value = line.strip().split("=", 1)
-                            os.environ[key] = value
+                # One read + one regex pass instead of per-line parsing;
+                # setdefault so variables already set in the environment win
+                text = env_file.read_text(encoding="utf-8", errors="ignore")
+                for key, value in _ENV_LINE_RE.findall(text):
+                    os.environ.setdefault(key, value)
                 print(f"✅ Loaded environment from {env_file}")
                 break
     
@@ -269,59 +603,34 @@ class EnhancedBrowserInterface:
 
             self.session_data["execution_state"] = "running"
 
+            # Bind the running loop so Gradio callbacks can answer prompts
+            self.prompt_manager.bind_loop()
+
             # Get file context
             file_context = self.file_manager.get_all_files_context()
 
             # Build enhanced prompt with file context and interactive capabilities
-            enhanced_command = f"""
-{command}
-
-{file_context}
-
-INTERACTIVE AUTOMATION INSTRUCTIONS:
-1. You can request user input during execution by saying "REQUEST_USER_INPUT: [your question]"
-2. If you need clarification or direction, pause and ask the user
-3. Use uploaded file context when relevant (resumes, cover letters, etc.)
-4. For complex workflows, break them into steps and confirm with user
-5. If credentials provided: username="{username}", password="{password}"
-6. Take screenshots at key decision points
-7. Handle authentication and multi-step processes carefully
-8. If you encounter unexpected situations, ask for user guidance
-
-SPECIAL FILE REFERENCES:
-- When user mentions "my resume" or "resume", refer to uploaded resume files
-- When user mentions "cover letter", refer to uploaded cover letter files
-- Use file content to fill forms or provide context-appropriate responses
-
-Execute this command with interactive capabilities and comprehensive feedback.
-"""
+            enhanced_command = _ENHANCED_TEMPLATE.format(
+                command=command,
+                file_context=file_context,
+                username=username,
+                password=password
+            )
 
             print(f"🚀 Executing interactive command: {command}")
 
             # Bring browser to front and center
-            WindowManager.bring_to_front_and_center()
+            await WindowManager.bring_to_front_and_center()
 
-            # Create agent with enhanced settings and window positioning
+            # Create agent against the shared browser; only the first
+            # command pays the Chromium launch (or CDP connect)
             agent = Agent(
                 task=enhanced_command,
                 llm=self.llm,
                 use_vision=True,
                 max_failures=3,
                 retry_delay=2,
-                browser_args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                    '--disable-gpu',
-                    '--window-size=1920,1080',
-                    '--window-position=100,100',  # Position window
-                    '--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor',
-                    '--exclude-switches=enable-automation',
-                    '--disable-infobars',
-                    '--no-first-run'
-                ]
+                browser=await self._get_browser()
             )
 
             # Execute with interactive monitoring
@@ -331,7 +640,7 @@ Execute this command with interactive capabilities and comprehensive feedback.
             self.session_data["conversation_history"].append({
                 "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
                 "command": command,
-                "result": str(result),
+                "result": str(result)[:_MAX_HISTORY_RESULT_CHARS],
                 "credentials_used": bool(username),
                 "files_used": len(self.file_manager.files) > 0
             })
@@ -344,9 +653,13 @@ Execute this command with interactive capabilities and comprehensive feedback.
                         current_page = pages[0]
                         self.session_data["current_url"] = current_page.url
 
-                        # Take screenshot
-                        screenshot_path = f"/tmp/browser_screenshot_{int(time.time())}.png"
-                        await current_page.screenshot(path=screenshot_path)
+                        # Take screenshot as bytes and write without
+                        # blocking the event loop on disk I/O, into the
+                        # next ring slot
+                        screenshot_path = str(self._ss_ring[self._ss_idx])
+                        self._ss_idx = (self._ss_idx + 1) % len(self._ss_ring)
+                        screenshot_bytes = await current_page.screenshot(type="png")
+                        await self._write_screenshot(screenshot_path, screenshot_bytes)
                         self.session_data["last_screenshot"] = screenshot_path
                         print(f"📸 Screenshot saved: {screenshot_path}")
             except Exception as e:
@@ -365,22 +678,72 @@ Execute this command with interactive capabilities and comprehensive feedback.
             print(error_msg)
             return error_msg
 
+    async def _get_browser(self):
+        """Launch (or connect to) Chromium once and reuse it across every
+        Agent invocation instead of spinning up a fresh browser per command"""
+        async with self._browser_lock:
+            if self._browser is None:
+                from playwright.async_api import async_playwright
+                self._browser_playwright = await async_playwright().start()
+                if self.cdp_url:
+                    self._browser = await self._browser_playwright.chromium.connect_over_cdp(self.cdp_url)
+                else:
+                    self._browser = await self._browser_playwright.chromium.launch(
+                        headless=False,
+                        args=[
+                            '--disable-blink-features=AutomationControlled',
+                            '--disable-dev-shm-usage',
+                            '--no-sandbox',
+                            '--disable-gpu',
+                            '--window-size=1920,1080',
+                            '--window-position=100,100',  # Position window
+                            '--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                            '--disable-web-security',
+                            '--disable-features=VizDisplayCompositor',
+                            '--exclude-switches=enable-automation',
+                            '--disable-infobars',
+                            '--no-first-run'
+                        ]
+                    )
+            return self._browser
+
+    async def close_browser(self):
+        """Close the shared browser and stop its Playwright instance"""
+        async with self._browser_lock:
+            if self._browser is not None:
+                await self._browser.close()
+                self._browser = None
+            if self._browser_playwright is not None:
+                await self._browser_playwright.stop()
+                self._browser_playwright = None
+
+    @staticmethod
+    async def _write_screenshot(path: str, data: bytes):
+        """Write screenshot bytes via aiofiles when available, otherwise on
+        a worker thread, so the event loop never blocks on the PNG write"""
+        if AIOFILES_AVAILABLE:
+            async with aiofiles.open(path, "wb") as f:
+                await f.write(data)
+        else:
+            await asyncio.to_thread(Path(path).write_bytes, data)
+
     async def _execute_with_interaction_monitoring(self, agent):
         """Execute agent with monitoring for interaction requests"""
         # This would need to be implemented with custom agent monitoring
         # For now, we'll use the standard execution
         return await agent.run()
 
-    def handle_file_upload(self, files):
-        """Handle file uploads and extract content"""
+    async def handle_file_upload(self, files):
+        """Handle file uploads concurrently and extract content"""
         if not files:
             return "No files uploaded", []
 
-        uploaded_files = []
-        for file in files:
-            if hasattr(file, 'name'):
-                file_id = self.file_manager.save_file(file.name, os.path.basename(file.name))
-                uploaded_files.append(file_id)
+        # Each save blocks on copy + PDF/DOCX/OCR extraction, so run them
+        # on worker threads and gather instead of stacking them serially
+        uploaded_files = await asyncio.gather(*[
+            self.file_manager.save_file_async(file.name, os.path.basename(file.name))
+            for file in files if hasattr(file, 'name')
+        ])
 
         file_list = self.file_manager.list_files()
         status = f"✅ Uploaded {len(uploaded_files)} file(s). Total files: {len(file_list)}"
@@ -624,13 +987,11 @@ Execute this command with interactive capabilities and comprehensive feedback.
                     return "❌ Please enter a command", "", None, "Status: Error"
 
                 try:
-                    # Run async command
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    result = loop.run_until_complete(
+                    # Run on the persistent automation loop so browser and
+                    # HTTP state survive across clicks
+                    result = self.run_async(
                         self.execute_interactive_command(command, username, password)
                     )
-                    loop.close()
 
                     # Return result, current URL, screenshot, and status
                     current_url_val = self.session_data.get("current_url", "")
@@ -642,8 +1003,8 @@ Execute this command with interactive capabilities and comprehensive feedback.
                 except Exception as e:
                     return f"❌ Error: {str(e)}", "", None, "Status: Error"
 
-            def handle_file_upload_handler(files):
-                return self.handle_file_upload(files)
+            async def handle_file_upload_handler(files):
+                return await self.handle_file_upload(files)
 
             def respond_to_prompt_handler(response):
                 return self.respond_to_prompt(response)
@@ -667,7 +1028,10 @@ Execute this command with interactive capabilities and comprehensive feedback.
                         k: {"username": v["username"], "stored": True}
                         for k, v in display_data["credentials"].items()
                     }
-                return display_data, display_data.get("conversation_history", [])
+                # The history deque isn't JSON-serializable as-is
+                history = list(display_data.get("conversation_history", []))
+                display_data["conversation_history"] = history
+                return _to_plain_json(display_data), _to_plain_json(history)
 
             # Wire up events
             execute_btn.click(
@@ -5,11 +5,17 @@ Optimized for complex workflows like Turing.com login, navigation, and quiz comp
 """
 
 import asyncio
+import atexit
+import functools
 import gradio as gr
+import hashlib
 import os
 import sys
 import json
+import threading
 import time
+from collections import OrderedDict, deque
+from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
@@ -18,6 +24,33 @@ web_ui_path = Path.home() / "browser-use-complete" / "web-ui"
 if web_ui_path.exists():
     sys.path.insert(0, str(web_ui_path))
 
+# Optional symmetric encryption so stored passwords never sit in plain text
+# in process memory; the key lives only for this process
+try:
+    from cryptography.fernet import Fernet
+    _FERNET = Fernet(Fernet.generate_key())
+except ImportError:
+    _FERNET = None
+
+def _protect(password: str):
+    """Encrypt a password for in-memory storage when cryptography is there"""
+    if _FERNET is not None:
+        return _FERNET.encrypt(password.encode())
+    return password
+
+def _reveal(token) -> str:
+    """Decrypt a stored password back to plain text on demand"""
+    if _FERNET is not None and isinstance(token, bytes):
+        return _FERNET.decrypt(token).decode()
+    return token
+
+# Optional fast JSON for the payloads Gradio re-serializes on every event
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from browser_use import Agent
     from browser_use.llm import ChatOpenAI, ChatAnthropic
@@ -30,16 +63,94 @@ except ImportError as e:
     from browser_use import Agent
     from browser_use.llm import ChatOpenAI, ChatAnthropic
 
+# One long-lived asyncio loop on a daemon thread. Handlers submit
+# coroutines via run_coroutine_threadsafe instead of building and tearing
+# down a loop per click, so async resources (browser, HTTP pools) persist
+# between workflows
+_LOOP = asyncio.new_event_loop()
+threading.Thread(target=_LOOP.run_forever, name="workflow-loop", daemon=True).start()
+
+def run_async(coro, timeout=None):
+    """Run a coroutine on the persistent workflow loop and wait for it"""
+    return asyncio.run_coroutine_threadsafe(coro, _LOOP).result(timeout)
+
+# Static workflow instructions, hoisted so every call starts with a
+# byte-identical prefix. Providers with prompt-prefix caching (OpenAI's
+# automatic prefix cache, Anthropic's ephemeral cache) can then reuse the
+# server-side KV for this block instead of re-billing it on each workflow;
+# everything that varies (the command, the credential list) comes after it
+WORKFLOW_INSTRUCTIONS = """IMPORTANT INSTRUCTIONS:
+1. If you need credentials (username/password), ask the user to provide them
+2. Handle multi-step authentication flows carefully
+3. When navigating to quizzes or tests, provide detailed information about what's available
+4. For quiz completion, read questions carefully and provide accurate answers
+5. Take screenshots at key points to show progress
+6. If you encounter multiple choices, describe them clearly for user selection
+7. Be methodical and careful with form submissions
+8. Wait for pages to load completely before proceeding"""
+
+# Full task template, assembled once; per call only {command} and {creds}
+# are interpolated, keeping the static prefix byte-stable
+_TASK_TEMPLATE = WORKFLOW_INSTRUCTIONS + """
+
+TASK:
+{command}
+
+Available credentials in session: {creds}
+"""
+
+# Browser flags shared by every workflow agent
+_BROWSER_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-gpu',
+    '--window-size=1920,1080'
+]
+
 # Global state
 current_agent = None
+_current_agent_provider = None
+# Strong references to in-flight background writes; a bare create_task
+# can be garbage-collected before the write completes
+_pending_writes = set()
 session_data = {
     "credentials": {},
     "current_url": "",
     "quiz_data": [],
     "selected_quizzes": [],
-    "conversation_history": []
+    # Bounded so history rendering stays constant-time for long sessions
+    "conversation_history": deque(maxlen=100)
 }
 
+def _to_plain_json(obj):
+    """Round-trip a payload into plain JSON types before Gradio serializes
+    it; orjson handles the nested session/history blobs several times
+    faster than the stdlib, which stays as the fallback"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(orjson.dumps(obj, default=str))
+    return json.loads(json.dumps(obj, default=str))
+
+def _credentials_display():
+    """Credential panel projection: usernames only, never the passwords"""
+    return {
+        service: {"username": info["username"], "stored": True}
+        for service, info in session_data["credentials"].items()
+    }
+
+def _session_display():
+    """Session data as plain JSON types for the gr.JSON components (the
+    history deque isn't serializable, and passwords stay out of the UI)"""
+    display = dict(session_data)
+    display["credentials"] = _credentials_display()
+    display["conversation_history"] = list(session_data["conversation_history"])
+    return _to_plain_json(display)
+
+def _now() -> str:
+    """Second-resolution timestamp; datetime.isoformat skips the strftime
+    format parse and localtime table lookup on every history append"""
+    return datetime.now().isoformat(sep=" ", timespec="seconds")
+
 def load_env_vars():
     """Load environment variables from .env files"""
     env_files = [
@@ -49,82 +160,175 @@ def load_env_vars():
     
     for env_file in env_files:
         if env_file.exists():
-            with open(env_file) as f:
-                for line in f:
-                    if line.strip() and not line.startswith("#") and "=" in line:
-                        key, value = line.strip().split("=", 1)
-                        os.environ[key] = value
+            # One read, one pass over the lines, one batch environ update
+            # instead of per-line strip/split plus N putenv calls
+            text = env_file.read_text()
+            pairs = (
+                line.partition("=")
+                for line in text.splitlines()
+                if line and not line.startswith("#") and "=" in line
+            )
+            os.environ.update({key.strip(): value.strip() for key, _, value in pairs})
             print(f"✅ Loaded environment from {env_file}")
             break
 
+@functools.lru_cache(maxsize=8)
+def _build_llm(provider: str, model: str, api_key: str):
+    """Construct an LLM client once per (provider, model, key); repeated
+    workflows then reuse the same client and its HTTP connection pool
+    instead of paying object construction plus a TLS handshake per call"""
+    if provider == "anthropic":
+        return ChatAnthropic(
+            model=model,
+            api_key=api_key,
+            temperature=0.3,
+            max_tokens=4000
+        )
+    return ChatOpenAI(
+        model=model,
+        api_key=api_key,
+        temperature=0.3,  # Lower temperature for more consistent behavior
+        max_tokens=4000
+    )
+
+# TTL cache for identical LLM calls. The quick templates produce repeated
+# byte-identical prompts, and at temperature 0.3 a cached answer for an
+# identical prompt is still a valid answer; a hit costs microseconds
+# instead of a ~1.5 s API round trip
+_LLM_CACHE_TTL = 3600
+_LLM_CACHE_MAX = 1000
+_llm_response_cache = OrderedDict()  # key -> (expires_at, response)
+
+class CachedLLM:
+    """Thin proxy over an LLM client that memoizes ainvoke responses for
+    identical prompts; everything else passes straight through"""
+
+    def __init__(self, llm, model: str):
+        self._llm = llm
+        self._model = model
+
+    def __getattr__(self, name):
+        return getattr(self._llm, name)
+
+    def _cache_key(self, prompt) -> str:
+        payload = json.dumps(
+            {"p": str(prompt), "m": self._model, "t": 0.3}, sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def ainvoke(self, input, *args, **kwargs):
+        key = self._cache_key(input)
+        now = time.time()
+        hit = _llm_response_cache.get(key)
+        if hit is not None and hit[0] > now:
+            _llm_response_cache.move_to_end(key)
+            return hit[1]
+
+        response = await self._llm.ainvoke(input, *args, **kwargs)
+        _llm_response_cache[key] = (now + _LLM_CACHE_TTL, response)
+        _llm_response_cache.move_to_end(key)
+        while len(_llm_response_cache) > _LLM_CACHE_MAX:
+            _llm_response_cache.popitem(last=False)
+        return response
+
 def get_llm(provider="openai"):
     """Get LLM instance with enhanced settings for complex workflows"""
     api_keys = {
         "openai": os.getenv("OPENAI_API_KEY"),
         "anthropic": os.getenv("ANTHROPIC_API_KEY"),
     }
-    
+
     if provider == "openai" and api_keys["openai"] and api_keys["openai"] != "your_openai_api_key_here":
-        return ChatOpenAI(
-            model="gpt-4", 
-            api_key=api_keys["openai"],
-            temperature=0.3,  # Lower temperature for more consistent behavior
-            max_tokens=4000
-        )
+        return CachedLLM(_build_llm("openai", "gpt-4", api_keys["openai"]), "gpt-4")
     elif provider == "anthropic" and api_keys["anthropic"] and api_keys["anthropic"] != "your_anthropic_api_key_here":
-        return ChatAnthropic(
-            model="claude-3-sonnet-20240229", 
-            api_key=api_keys["anthropic"],
-            temperature=0.3,
-            max_tokens=4000
+        return CachedLLM(
+            _build_llm("anthropic", "claude-3-sonnet-20240229", api_keys["anthropic"]),
+            "claude-3-sonnet-20240229"
         )
     else:
-        print("⚠️  No valid API key found. Using demo mode.")
-        return ChatOpenAI(model="gpt-3.5-turbo", api_key="demo", base_url="http://localhost:1234/v1")
+        # No key: return None so callers fail fast instead of the old demo
+        # fallback, which dialed a localhost endpoint that is usually closed
+        # and stalled every workflow on a socket timeout. main() already
+        # warns about missing keys once at startup
+        return None
+
+# Short-TTL result cache so an accidental re-click of the same command
+# doesn't launch a whole new browser+LLM pipeline
+_WORKFLOW_CACHE_TTL = 60
+_WORKFLOW_CACHE_MAX = 64
+_workflow_cache = OrderedDict()  # key -> (expires_at, result tuple)
+
+# In-flight identical commands share one run: the second submitter awaits
+# the first one's future instead of launching a second browser
+_inflight: Dict[str, asyncio.Future] = {}
 
 async def execute_complex_workflow(command: str, provider: str = "openai", credentials: Dict = None) -> tuple[str, str, str]:
     """Execute complex multi-step workflows with credential handling"""
+    cache_key = hashlib.sha256(f"{provider}:{command}".encode()).hexdigest()
+    hit = _workflow_cache.get(cache_key)
+    if hit is not None and hit[0] > time.time():
+        _workflow_cache.move_to_end(cache_key)
+        print("⚡ Identical command within the last minute - returning cached result")
+        return hit[1]
+
+    fut = _inflight.get(cache_key)
+    if fut is not None:
+        print("⏳ Identical command already running - sharing its result")
+        return await asyncio.shield(fut)
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[cache_key] = fut
+    try:
+        result = await _run_workflow(command, provider, cache_key)
+        fut.set_result(result)
+        return result
+    finally:
+        _inflight.pop(cache_key, None)
+        if not fut.done():
+            fut.cancel()
+
+async def _run_workflow(command: str, provider: str, cache_key: str) -> tuple[str, str, str]:
+    """The actual workflow body; callers go through execute_complex_workflow
+    so caching and single-flight coalescing apply"""
     global current_agent, session_data
-    
+
     try:
         llm = get_llm(provider)
-        
-        # Enhanced task prompt for complex workflows
-        enhanced_task = f"""
-{command}
-
-IMPORTANT INSTRUCTIONS:
-1. If you need credentials (username/password), ask the user to provide them
-2. Handle multi-step authentication flows carefully
-3. When navigating to quizzes or tests, provide detailed information about what's available
-4. For quiz completion, read questions carefully and provide accurate answers
-5. Take screenshots at key points to show progress
-6. If you encounter multiple choices, describe them clearly for user selection
-7. Be methodical and careful with form submissions
-8. Wait for pages to load completely before proceeding
+        if llm is None:
+            return (
+                f"❌ No {provider} API key configured",
+                "Add the API key to your .env file and restart",
+                "No screenshot available"
+            )
 
-Available credentials in session: {list(session_data['credentials'].keys()) if session_data['credentials'] else 'None'}
-"""
-        
-        # Create agent with enhanced settings for complex workflows
-        agent = Agent(
-            task=enhanced_task,
-            llm=llm,
-            use_vision=True,
-            max_failures=5,  # Allow more retries for complex workflows
-            retry_delay=2,   # Longer delay between retries
-            # Enhanced browser settings
-            browser_args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-                '--disable-gpu',
-                '--window-size=1920,1080'
-            ]
+        # Static instructions first so the cacheable prefix stays identical
+        # across workflows; only the task and credential list vary below it
+        enhanced_task = _TASK_TEMPLATE.format(
+            command=command,
+            creds=", ".join(session_data["credentials"]) or "None"
         )
         
-        current_agent = agent
-        
+        # Reuse the warm agent (and its Chromium, with login state intact)
+        # when one exists for this provider. add_new_task feeds the command
+        # into the agent's message state; reassigning .task would not, since
+        # browser-use only reads it at construction. A fresh agent — and the
+        # 1-3 s browser launch — is paid on first use or after a reset
+        global _current_agent_provider
+        if current_agent is not None and _current_agent_provider == provider:
+            current_agent.add_new_task(enhanced_task)
+            agent = current_agent
+        else:
+            agent = Agent(
+                task=enhanced_task,
+                llm=llm,
+                use_vision=True,
+                max_failures=5,  # Allow more retries for complex workflows
+                retry_delay=2,   # Longer delay between retries
+                browser_args=_BROWSER_ARGS
+            )
+            current_agent = agent
+            _current_agent_provider = provider
+
         print(f"🚀 Executing complex workflow: {command}")
         
         # Execute with progress tracking
@@ -132,7 +336,7 @@ Available credentials in session: {list(session_data['credentials'].keys()) if s
         
         # Store session data
         session_data["conversation_history"].append({
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": _now(),
             "command": command,
             "result": str(result),
             "provider": provider
@@ -142,19 +346,37 @@ Available credentials in session: {list(session_data['credentials'].keys()) if s
         screenshot_path = None
         try:
             if agent.browser:
-                screenshot_path = f"/tmp/workflow_screenshot_{int(time.time())}.png"
+                screenshot_path = f"/tmp/workflow_screenshot_{time.time_ns()}.png"
                 # Get current page info
                 page = agent.browser.pages[0] if agent.browser.pages else None
                 if page:
-                    await page.screenshot(path=screenshot_path)
+                    # Capture to memory, then let a background thread do the
+                    # PNG write so the workflow result isn't gated on disk
+                    # I/O. The task is kept referenced until done - asyncio
+                    # may garbage-collect an unreferenced task mid-write
+                    png = await page.screenshot()
+                    write_task = asyncio.create_task(
+                        asyncio.to_thread(Path(screenshot_path).write_bytes, png)
+                    )
+                    _pending_writes.add(write_task)
+                    write_task.add_done_callback(_pending_writes.discard)
                     session_data["current_url"] = page.url
         except Exception as e:
             print(f"Screenshot warning: {e}")
         
         success_msg = f"✅ Complex workflow executed successfully"
         result_msg = f"Result: {result}"
-        screenshot_msg = f"Screenshot saved: {screenshot_path}" if screenshot_path else "No screenshot available"
-        
+        screenshot_msg = f"Screenshot queued: {screenshot_path}" if screenshot_path else "No screenshot available"
+
+        # Only successful runs are cached; failures should always retry
+        _workflow_cache[cache_key] = (
+            time.time() + _WORKFLOW_CACHE_TTL,
+            (success_msg, result_msg, screenshot_msg)
+        )
+        _workflow_cache.move_to_end(cache_key)
+        while len(_workflow_cache) > _WORKFLOW_CACHE_MAX:
+            _workflow_cache.popitem(last=False)
+
         return success_msg, result_msg, screenshot_msg
         
     except Exception as e:
@@ -162,13 +384,43 @@ Available credentials in session: {list(session_data['credentials'].keys()) if s
         print(error_msg)
         return error_msg, f"Error details: {str(e)}", "No screenshot due to error"
 
+async def close_agent():
+    """Close the cached agent's browser so the next workflow starts fresh"""
+    global current_agent, _current_agent_provider
+    if current_agent is not None:
+        try:
+            if getattr(current_agent, "browser", None):
+                await current_agent.browser.close()
+        except Exception as e:
+            print(f"Browser close warning: {e}")
+        current_agent = None
+        _current_agent_provider = None
+
+def _close_agent_at_exit():
+    if current_agent is not None:
+        try:
+            run_async(close_agent(), timeout=10)
+        except Exception:
+            pass
+
+atexit.register(_close_agent_at_exit)
+
+def get_credential(service: str) -> Optional[Dict]:
+    """Fetch a stored credential, decrypting the password on demand"""
+    info = session_data["credentials"].get(service)
+    if info is None:
+        return None
+    return {"username": info["username"], "password": _reveal(info["password"])}
+
 def handle_credential_input(username: str, password: str, service: str = "turing"):
     """Store credentials securely in session"""
     if username and password:
         session_data["credentials"][service] = {
             "username": username,
-            "password": password,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+            # Encrypted at rest in process memory; decrypted only when a
+            # workflow actually needs it via get_credential
+            "password": _protect(password),
+            "timestamp": _now()
         }
         return f"✅ Credentials stored for {service}"
     return "❌ Please provide both username and password"
@@ -262,14 +514,18 @@ def create_enhanced_interface():
                         "Complete all pending turing.com assessments with perfect scores"
                     ]
                     
-                    for i, template in enumerate(templates):
-                        gr.Button(
-                            f"Template {i+1}: {template[:60]}...",
-                            size="sm"
-                        ).click(
-                            fn=lambda t=template: t,
-                            outputs=workflow_command
-                        )
+                    # One dropdown + one change event instead of five buttons
+                    # each registering its own closure and launch payload
+                    template_picker = gr.Dropdown(
+                        choices=templates,
+                        label="Pick a template",
+                        value=None
+                    )
+                    template_picker.change(
+                        fn=lambda t: t,
+                        inputs=template_picker,
+                        outputs=workflow_command
+                    )
                 
                 with gr.Column(scale=2):
                     # Results area
@@ -308,7 +564,7 @@ def create_enhanced_interface():
                     gr.HTML("<h3>🌐 Current Session</h3>")
                     session_display = gr.JSON(
                         label="Session Information",
-                        value=session_data
+                        value=_session_display()
                     )
                 
                 with gr.Column():
@@ -359,39 +615,39 @@ def create_enhanced_interface():
                         value="1920x1080",
                         label="Browser Window Size"
                     )
-        
+
+                    reset_browser_btn = gr.Button("🔄 Reset Browser", variant="secondary")
+                    reset_status = gr.Textbox(
+                        label="Reset Status",
+                        lines=1,
+                        interactive=False
+                    )
+
         # Event handlers
         def execute_workflow_handler(command, provider):
-            """Handle workflow execution"""
+            """Handle workflow execution; returns only the primary result
+            outputs - the JSON panels refresh in chained steps afterwards"""
             if not command.strip():
                 return (
                     "<div class='status-error'>❌ Please enter a command</div>",
                     "No command provided",
                     "",
-                    "",
-                    session_data["credentials"],
-                    session_data,
-                    session_data["conversation_history"]
+                    ""
                 )
-            
-            # Run async function
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+
+            # Submit onto the persistent loop instead of building one per click
             try:
-                result = loop.run_until_complete(
+                result = run_async(
                     execute_complex_workflow(command, provider, session_data["credentials"])
                 )
-                
+
                 status_html = f"<div class='status-success'>✅ Workflow completed</div>"
-                
+
                 return (
                     status_html,
                     result[0],
-                    result[1], 
-                    result[2],
-                    session_data["credentials"],
-                    session_data,
-                    session_data["conversation_history"]
+                    result[1],
+                    result[2]
                 )
             except Exception as e:
                 error_html = f"<div class='status-error'>❌ Error: {str(e)}</div>"
@@ -399,24 +655,37 @@ def create_enhanced_interface():
                     error_html,
                     f"Error: {str(e)}",
                     "",
-                    "",
-                    session_data["credentials"],
-                    session_data,
-                    session_data["conversation_history"]
+                    ""
                 )
-            finally:
-                loop.close()
-        
+
+        # Small projectors over the shared session state; each is O(view
+        # size) and runs after the primary result has already rendered
+        def project_session():
+            return _session_display()
+
+        def project_history():
+            return list(session_data["conversation_history"])
+
+        def reset_browser_handler():
+            """Close the cached agent/browser so the next run starts cold"""
+            try:
+                run_async(close_agent(), timeout=30)
+                return "✅ Browser closed - next workflow starts fresh"
+            except Exception as e:
+                return f"❌ Reset failed: {str(e)}"
+
         def store_credentials_handler(service, username, password):
             """Handle credential storage"""
             result = handle_credential_input(username, password, service)
             return (
                 result,
-                session_data["credentials"],
-                session_data
+                _credentials_display(),
+                _session_display()
             )
         
-        # Wire up events
+        # Wire up events. The JSON panels refresh in follow-up steps so the
+        # workflow result reaches the client without waiting on them; the
+        # credentials panel only changes via its own handler
         execute_btn.click(
             fn=execute_workflow_handler,
             inputs=[workflow_command, provider_select],
@@ -424,11 +693,14 @@ def create_enhanced_interface():
                 result_status,
                 result_output,
                 detail_output,
-                screenshot_info,
-                credentials_display,
-                session_display,
-                history_display
+                screenshot_info
             ]
+        ).then(
+            fn=project_session,
+            outputs=session_display
+        ).then(
+            fn=project_history,
+            outputs=history_display
         )
         
         store_creds_btn.click(
@@ -436,16 +708,35 @@ def create_enhanced_interface():
             inputs=[service_name, username_input, password_input],
             outputs=[result_output, credentials_display, session_display]
         )
+
+        reset_browser_btn.click(
+            fn=reset_browser_handler,
+            outputs=reset_status
+        )
     
     return interface
 
+def _warmup():
+    """Pull the heavy lazy imports (Playwright, the LLM client stack) in on
+    a background thread so the first workflow click doesn't pay for them"""
+    try:
+        import playwright.async_api  # noqa: F401
+        # Constructing the client here also primes the lru_cache and the
+        # underlying HTTP machinery
+        get_llm("openai") or get_llm("anthropic")
+    except Exception as e:
+        print(f"Warmup warning: {e}")
+
 def main():
     """Main function"""
     print("🚀 Starting Enhanced Browser-Use AI for Complex Workflows...")
-    
+
     # Load environment variables
     load_env_vars()
-    
+
+    # Warm lazy imports while the interface is still starting up
+    threading.Thread(target=_warmup, daemon=True).start()
+
     # Check API keys
     openai_key = os.getenv("OPENAI_API_KEY", "")
     anthropic_key = os.getenv("ANTHROPIC_API_KEY", "")
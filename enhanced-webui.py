@@ -6,11 +6,15 @@ No safety checks - pure command execution as requested
 """
 
 import asyncio
+import functools
 import gradio as gr
-import speech_recognition as sr
+import io
+import re
 import threading
 import queue
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
 import sys
@@ -18,42 +22,177 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 import subprocess
 import tempfile
+from PIL import Image
+
+# Lazy dependency installers: each pip run happens at most once (cached)
+# and only when the dependency is actually needed, so startup never waits
+# on installs it doesn't need
+_PIP_FLAGS = ["--no-input", "--disable-pip-version-check"]
+
+@functools.cache
+def _ensure_browser_use():
+    """Install browser-use on first need"""
+    try:
+        import browser_use  # noqa: F401
+    except ImportError:
+        print("⚠️  Browser-use library not found. Installing...")
+        subprocess.check_call(
+            [sys.executable, "-m", "pip", "install", *_PIP_FLAGS, "browser-use"]
+        )
+
+@functools.cache
+def _ensure_speech_recognition():
+    """Install speech recognition on first need (voice handler creation)"""
+    try:
+        import speech_recognition  # noqa: F401
+    except ImportError:
+        print("⚠️  Installing speech recognition...")
+        subprocess.check_call(
+            [sys.executable, "-m", "pip", "install", *_PIP_FLAGS,
+             "speechrecognition", "pyaudio"]
+        )
+
+# Voice support is optional until the handler is created; text commands
+# work without it
+try:
+    import speech_recognition as sr
+except ImportError:
+    sr = None
 
 # Try to import browser_use components
 try:
     from browser_use import Agent
     from browser_use.llm import ChatOpenAI, ChatAnthropic, ChatGoogleGenerativeAI
 except ImportError:
-    print("⚠️  Browser-use library not found. Installing...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "browser-use"])
+    _ensure_browser_use()
     from browser_use import Agent
     from browser_use.llm import ChatOpenAI, ChatAnthropic, ChatGoogleGenerativeAI
 
+# Optional local ASR: an in-process Whisper model removes the 200-800 ms
+# network round trip (and rate limits) of the Google Web Speech API
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+# Optional numpy for fast microphone calibration; the speech_recognition
+# fallback still works without it
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Wake words shared by the voice handler and command normalization
+WAKE_WORDS = ("hey browser", "browser", "execute", "do this", "run this")
+
+_WS_RE = re.compile(r"\s+")
+
+def _normalize_command(command: str) -> str:
+    """Canonical form for caching: lowercased, wake words stripped,
+    whitespace collapsed - voice mode often produces duplicates that only
+    differ in these ways"""
+    text = command.lower()
+    for wake_word in WAKE_WORDS:
+        text = text.replace(wake_word, " ")
+    return _WS_RE.sub(" ", text).strip()
+
+# Short-TTL cache of successful results keyed by (provider, normalized
+# command); a repeat within the window skips the whole agent/LLM round
+# trip. Bounded: expired keys are pruned and the oldest entries evicted
+# on insert, so a long voice session can't grow the dict (and the result
+# strings it holds) without limit
+_RESPONSE_CACHE_TTL = 300
+_RESPONSE_CACHE_MAX = 256
+_response_cache = OrderedDict()  # key -> (expires_at, (status, details))
+
+def _cache_response(cache_key, response):
+    """Insert a result, dropping expired keys and enforcing the cap"""
+    now = time.time()
+    for key in [k for k, (expires_at, _) in _response_cache.items() if expires_at <= now]:
+        del _response_cache[key]
+    _response_cache[cache_key] = (now + _RESPONSE_CACHE_TTL, response)
+    while len(_response_cache) > _RESPONSE_CACHE_MAX:
+        _response_cache.popitem(last=False)
+
+def clear_response_cache():
+    """Drop cached command results (wired to the Clear button)"""
+    _response_cache.clear()
+
+# One long-lived event loop on a daemon thread; voice cycles and UI
+# handlers submit coroutines here instead of building and closing a loop
+# per command, which kept tearing down the agent's HTTP pools and
+# re-paying DNS/TLS handshakes on every short command
+_LOOP = asyncio.new_event_loop()
+threading.Thread(target=_LOOP.run_forever, name="command-loop", daemon=True).start()
+
+def run_async(coro, timeout=None):
+    """Run a coroutine on the persistent command loop and wait for it"""
+    return asyncio.run_coroutine_threadsafe(coro, _LOOP).result(timeout)
+
 # Global state
-current_agent = None
+# One long-lived Agent per provider: follow-up commands are added as new
+# turns on the same conversation, so the provider's prompt-prefix cache
+# covers the shared history instead of re-prefilling it every command
+_agents: Dict[str, Agent] = {}
 voice_handler = None
-conversation_history = []
+# Bounded so an hours-long voice session can't grow memory (or history
+# serialization time) without limit
+conversation_history = deque(maxlen=500)
+# Compact table rows mirroring conversation_history, built one row per
+# command so the history widget never re-serializes full result dicts
+history_rows = deque(maxlen=500)
 session_state = {
     "current_llm": "openai",
     "voice_enabled": False,
     "auto_execute": True,
-    "last_screenshot": None
+    "last_screenshot_bytes": None
 }
 
 class EnhancedVoiceHandler:
     """Enhanced voice command handler with continuous listening"""
     
     def __init__(self):
+        global sr
+        if sr is None:
+            # First actual use of voice: install and import on demand
+            _ensure_speech_recognition()
+            import speech_recognition as sr
         self.recognizer = sr.Recognizer()
         self.microphone = sr.Microphone()
         self.listening = False
         self.command_queue = queue.Queue()
-        self.wake_words = ["hey browser", "browser", "execute", "do this", "run this"]
-        
+        self.wake_words = list(WAKE_WORDS)
+        # One alternation regex replaces per-wake-word scans; longest
+        # phrases first so "hey browser" wins over the bare "browser"
+        self._wake_re = re.compile(
+            "|".join(map(re.escape, sorted(self.wake_words, key=len, reverse=True))),
+            re.IGNORECASE,
+        )
+        # Load the local ASR model once; int8 quantization keeps the
+        # tiny.en model fast enough for short phrases on CPU
+        self._asr = None
+        if FASTER_WHISPER_AVAILABLE:
+            try:
+                self._asr = WhisperModel("tiny.en", device="cpu", compute_type="int8")
+                print("🎙️  Local Whisper model loaded (tiny.en)")
+            except Exception as e:
+                print(f"⚠️  Local ASR unavailable, using Google Web API: {e}")
+
         # Calibrate microphone
         try:
             with self.microphone as source:
-                self.recognizer.adjust_for_ambient_noise(source, duration=1)
+                if NUMPY_AVAILABLE:
+                    # One vectorized RMS over a short ambient buffer instead
+                    # of adjust_for_ambient_noise's per-frame Python loop
+                    raw = source.stream.read(source.CHUNK * 30)
+                    samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32)
+                    if samples.size:
+                        energy = float(np.sqrt(np.mean(samples * samples)))
+                        self.recognizer.energy_threshold = energy * 1.5
+                else:
+                    self.recognizer.adjust_for_ambient_noise(source, duration=1)
             print("🎙️  Voice handler initialized successfully")
         except Exception as e:
             print(f"⚠️  Voice handler initialization warning: {e}")
@@ -78,15 +217,14 @@ class EnhancedVoiceHandler:
                     audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=10)
                 
                 try:
-                    # Recognize speech using Google Web Speech API
-                    command = self.recognizer.recognize_google(audio).lower()
-                    
-                    # Check for wake words or direct execution
-                    if any(wake_word in command for wake_word in self.wake_words) or session_state.get("auto_execute", True):
-                        # Remove wake words and clean command
-                        for wake_word in self.wake_words:
-                            command = command.replace(wake_word, "").strip()
-                        
+                    command = self._transcribe(audio)
+
+
+                    # Strip wake words in one scan; the substitution count
+                    # doubles as the "wake word present" signal
+                    command, n_wake = self._wake_re.subn("", command)
+                    command = command.strip()
+                    if n_wake > 0 or session_state.get("auto_execute", True):
                         if command:  # Only queue non-empty commands
                             self.command_queue.put(command)
                             print(f"🎙️  Voice command received: {command}")
@@ -104,6 +242,15 @@ class EnhancedVoiceHandler:
                 print(f"Voice listening error: {e}")
                 time.sleep(1)
     
+    def _transcribe(self, audio) -> str:
+        """Transcribe one utterance locally when the Whisper model is
+        loaded, otherwise fall back to the Google Web Speech API"""
+        if self._asr is not None:
+            buf = io.BytesIO(audio.get_wav_data())
+            segments, _ = self._asr.transcribe(buf, beam_size=1, vad_filter=True)
+            return " ".join(segment.text for segment in segments).lower().strip()
+        return self.recognizer.recognize_google(audio).lower()
+
     def get_command(self) -> Optional[str]:
         """Get the next voice command from queue"""
         try:
@@ -111,6 +258,23 @@ class EnhancedVoiceHandler:
         except queue.Empty:
             return None
 
+    def get_all_commands(self) -> list:
+        """Drain every queued command in one go, deduplicating phrases that
+        normalize to the same text, so a burst of speech isn't delivered at
+        one command per poll tick"""
+        commands = []
+        seen = set()
+        while True:
+            try:
+                command = self.command_queue.get_nowait()
+            except queue.Empty:
+                break
+            key = _normalize_command(command)
+            if key and key not in seen:
+                seen.add(key)
+                commands.append(command)
+        return commands
+
 def get_llm_instance(provider: str = "openai"):
     """Get LLM instance based on provider"""
     api_keys = {
@@ -146,15 +310,22 @@ def get_llm_instance(provider: str = "openai"):
 
 async def execute_browser_command(command: str, llm_provider: str = "openai") -> tuple[str, str]:
     """Execute browser command directly with no safety checks"""
-    global current_agent, conversation_history
-    
+    global conversation_history
+
+    cache_key = (llm_provider, _normalize_command(command))
+    hit = _response_cache.get(cache_key)
+    if hit is not None and hit[0] > time.time():
+        print(f"⚡ Repeated command within {_RESPONSE_CACHE_TTL}s - returning cached result")
+        return hit[1]
+
     try:
         # Get LLM instance
         llm = get_llm_instance(llm_provider)
         
-        # Create or reuse agent
-        if not current_agent:
-            current_agent = Agent(
+        # Create or reuse the agent for this provider
+        agent = _agents.get(llm_provider)
+        if agent is None:
+            agent = Agent(
                 task=command,
                 llm=llm,
                 # Remove any safety constraints
@@ -166,103 +337,173 @@ async def execute_browser_command(command: str, llm_provider: str = "openai") ->
                 enable_memory=True,
                 max_memory_entries=1000
             )
+            _agents[llm_provider] = agent
         else:
-            # Update task for existing agent
-            current_agent.task = command
-            current_agent.llm = llm
-        
+            # Append the command as a follow-up turn rather than mutating
+            # .task, so the existing conversation prefix stays byte-stable
+            agent.add_new_task(command)
+
         # Execute the command directly
         print(f"🚀 Executing: {command}")
-        result = await current_agent.run()
+        result = await agent.run()
         
         # Add to conversation history
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
         conversation_history.append({
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": timestamp,
             "command": command,
             "result": str(result),
             "llm_provider": llm_provider
         })
+        # One truncated display row per command; the full result stays in
+        # conversation_history
+        history_rows.append([timestamp, command, str(result)[:500], llm_provider])
         
-        # Take screenshot after execution
+        # Take screenshot after execution, kept as bytes: one PNG encode in
+        # the browser, no disk write, no re-decode when the UI displays it
         try:
-            if current_agent.browser:
-                screenshot_path = f"/tmp/browser_screenshot_{int(time.time())}.png"
-                await current_agent.browser.screenshot(path=screenshot_path)
-                session_state["last_screenshot"] = screenshot_path
+            if agent.browser:
+                png_bytes = await agent.browser.screenshot(type="png")
+                # Re-encode off the loop; PIL releases the GIL in its codecs
+                session_state["last_screenshot_bytes"] = await asyncio.to_thread(
+                    _compress_screenshot, png_bytes
+                )
         except Exception as e:
             print(f"Screenshot capture warning: {e}")
         
-        return f"✅ Command executed successfully", f"Result: {result}"
-        
+        # Cache only successes; failures always re-run
+        response = (f"✅ Command executed successfully", f"Result: {result}")
+        _cache_response(cache_key, response)
+        return response
+
     except Exception as e:
         error_msg = f"❌ Execution failed: {str(e)}"
         print(error_msg)
         return error_msg, f"Error details: {str(e)}"
 
-def process_voice_commands():
-    """Background process to handle voice commands"""
-    global voice_handler
-    
-    if not voice_handler:
-        return "Voice handler not initialized"
-    
-    command = voice_handler.get_command()
-    if command:
-        # Execute voice command immediately
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
+def _compress_screenshot(png_bytes: bytes) -> bytes:
+    """Downscale and WebP-encode a PNG screenshot for the UI preview:
+    5-10x fewer bytes over the websocket with no visible loss at preview
+    size, which matters when the UI runs remotely"""
+    try:
+        img = Image.open(io.BytesIO(png_bytes))
+        img.thumbnail((1280, 1280))
+        buf = io.BytesIO()
+        img.save(buf, format="WEBP", quality=75, method=4)
+        return buf.getvalue()
+    except Exception:
+        return png_bytes  # An odd PNG still displays, just uncompressed
+
+async def _run_command_batch(commands):
+    """Run a drained voice batch back to back on the persistent loop.
+    Sequential on purpose: every command in the batch shares the one
+    cached Agent for the current provider, which is not reentrant - the
+    win comes from draining the queue in one go, not from racing one
+    agent against itself"""
+    results = []
+    for command in commands:
+        results.append(
+            await execute_browser_command(command, session_state["current_llm"])
+        )
+    return results
+
+# Per-command budget matching the rest of the repo's agent runs; a 60s
+# budget expired on routine commands and orphaned the batch mid-run
+_VOICE_COMMAND_TIMEOUT = 300
+
+# One voice batch at a time: the shared per-provider Agent is not
+# reentrant, so a new batch must wait for the previous one to finish
+_voice_batch_lock = threading.Lock()
+
+def process_voice_commands(commands):
+    """Execute a batch of voice commands on the persistent loop so queued
+    phrases don't trickle out one at a time"""
+    results = run_async(
+        _run_command_batch(commands),
+        timeout=_VOICE_COMMAND_TIMEOUT * len(commands)
+    )
+    return "\n\n".join(
+        f"🎙️  Voice: {command}\n{result[0]}\n{result[1]}"
+        for command, result in zip(commands, results)
+    )
+
+def voice_stream():
+    """Event-driven voice pipeline: blocks on the command queue and yields
+    only when speech actually arrives, replacing the old sub-second polling
+    that cost a websocket round trip per tick even on an idle session"""
+    while True:
+        if not (voice_handler and session_state.get("voice_enabled", False)):
+            time.sleep(0.5)
+            continue
         try:
-            result = loop.run_until_complete(
-                execute_browser_command(command, session_state["current_llm"])
-            )
-            return f"🎙️  Voice: {command}\n{result[0]}\n{result[1]}"
-        finally:
-            loop.close()
-    
-    return None
+            first = voice_handler.command_queue.get(timeout=1)
+        except queue.Empty:
+            continue
+        # Give the rest of a speech burst a beat to land, then drain it
+        time.sleep(0.2)
+        first_key = _normalize_command(first)
+        commands = [first] + [
+            command for command in voice_handler.get_all_commands()
+            if _normalize_command(command) != first_key
+        ]
+        # A failed batch is reported and the stream keeps going; letting
+        # the exception escape would kill voice push for the whole session
+        try:
+            with _voice_batch_lock:
+                yield process_voice_commands(commands)
+        except Exception as e:
+            yield f"❌ Voice batch failed: {e}"
+
+# Static UI pieces built once at import; create_interface can be called
+# repeatedly (dev live-reload) without re-instantiating the theme or
+# re-parsing the CSS each time
+_THEME = gr.themes.Dark()
+
+_CSS = """
+.gradio-container {
+    max-width: 1200px !important;
+}
+.main-header {
+    text-align: center;
+    background: linear-gradient(45deg, #1e3a8a, #7c3aed);
+    color: white;
+    padding: 20px;
+    border-radius: 10px;
+    margin-bottom: 20px;
+}
+.command-box {
+    border: 2px solid #3b82f6;
+    border-radius: 10px;
+    padding: 10px;
+}
+.voice-indicator {
+    background: #ef4444;
+    color: white;
+    padding: 5px 10px;
+    border-radius: 20px;
+    font-weight: bold;
+}
+"""
+
+_HEADER_HTML = """
+<div class="main-header">
+    <h1>🚀 Browser-Use AI: Direct Command Execution</h1>
+    <p>Natural Language & Voice Browser Automation</p>
+    <p><strong>⚡ No safety checks - Pure command execution</strong></p>
+</div>
+"""
 
 def create_interface():
     """Create the Gradio interface"""
-    
+
     with gr.Blocks(
         title="Browser-Use AI: Direct Command Execution",
-        theme=gr.themes.Dark(),
-        css="""
-        .gradio-container {
-            max-width: 1200px !important;
-        }
-        .main-header {
-            text-align: center;
-            background: linear-gradient(45deg, #1e3a8a, #7c3aed);
-            color: white;
-            padding: 20px;
-            border-radius: 10px;
-            margin-bottom: 20px;
-        }
-        .command-box {
-            border: 2px solid #3b82f6;
-            border-radius: 10px;
-            padding: 10px;
-        }
-        .voice-indicator {
-            background: #ef4444;
-            color: white;
-            padding: 5px 10px;
-            border-radius: 20px;
-            font-weight: bold;
-        }
-        """
+        theme=_THEME,
+        css=_CSS
     ) as interface:
-        
+
         # Header
-        gr.HTML("""
-        <div class="main-header">
-            <h1>🚀 Browser-Use AI: Direct Command Execution</h1>
-            <p>Natural Language & Voice Browser Automation</p>
-            <p><strong>⚡ No safety checks - Pure command execution</strong></p>
-        </div>
-        """)
+        gr.HTML(_HEADER_HTML)
         
         with gr.Row():
             with gr.Column(scale=2):
@@ -334,9 +575,12 @@ def create_interface():
         with gr.Row():
             with gr.Column():
                 gr.HTML("<h3>📜 Command History</h3>")
-                history_output = gr.JSON(
+                history_output = gr.Dataframe(
+                    headers=["time", "command", "result", "llm"],
+                    datatype=["str"] * 4,
                     label="Conversation History",
-                    value=conversation_history
+                    value=list(history_rows),
+                    interactive=False
                 )
         
         # Real-time voice processing
@@ -346,19 +590,20 @@ def create_interface():
         )
         
         # Event handlers
-        async def execute_command_handler(command, llm_prov):
-            """Handle command execution"""
+        def execute_command_handler(command, llm_prov):
+            """Handle command execution on the shared persistent loop"""
             if not command.strip():
-                return "❌ Please enter a command", "", None, conversation_history
-            
-            result, details = await execute_browser_command(command, llm_prov)
+                return "❌ Please enter a command", "", None, list(history_rows)
+
+            result, details = run_async(execute_browser_command(command, llm_prov))
             
-            # Update screenshot if available
+            # Update screenshot if available, straight from memory
             screenshot = None
-            if session_state.get("last_screenshot") and os.path.exists(session_state["last_screenshot"]):
-                screenshot = session_state["last_screenshot"]
+            png_bytes = session_state.get("last_screenshot_bytes")
+            if png_bytes:
+                screenshot = Image.open(io.BytesIO(png_bytes))
             
-            return result, details, screenshot, conversation_history
+            return result, details, screenshot, list(history_rows)
         
         def toggle_voice_handler(enabled, auto_exec):
             """Toggle voice command handling"""
@@ -384,7 +629,9 @@ def create_interface():
             return status
         
         def clear_inputs():
-            """Clear input fields"""
+            """Clear input fields, the response cache and screenshot bytes"""
+            clear_response_cache()
+            session_state["last_screenshot_bytes"] = None
             return "", "", ""
         
         def update_llm_provider(provider):
@@ -416,37 +663,34 @@ def create_interface():
             outputs=[result_output]
         )
         
-        # Periodic voice command checking
-        def check_voice_commands():
-            """Check for new voice commands"""
-            if session_state.get("voice_enabled", False):
-                return process_voice_commands()
-            return None
-        
-        # Auto-refresh for voice commands
+        # Voice results are pushed from the generator as they happen; no
+        # periodic polling when the queue is quiet
         interface.load(
-            fn=check_voice_commands,
-            outputs=[voice_output],
-            every=1  # Check every second
+            fn=voice_stream,
+            outputs=[voice_output]
         )
         
         voice_output.change(
-            fn=lambda x: (x, x, None, conversation_history) if x else (None, None, None, None),
+            fn=lambda x: (x, x, None, list(history_rows)) if x else (None, None, None, None),
             inputs=[voice_output],
             outputs=[result_output, details_output, screenshot_display, history_output]
         )
     
     return interface
 
+# KEY=value lines (optionally double-quoted values); the anchors skip
+# comments and blanks without per-line Python checks
+_ENV_RE = re.compile(r'(?m)^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*"?([^"\n]*?)"?\s*$')
+
 def load_environment():
     """Load environment variables from .env file"""
     env_file = Path(".env")
     if env_file.exists():
-        with open(env_file) as f:
-            for line in f:
-                if line.strip() and not line.startswith("#"):
-                    key, value = line.strip().split("=", 1)
-                    os.environ[key] = value
+        # One read and one C-level regex pass instead of strip/split per line
+        text = env_file.read_text()
+        os.environ.update({
+            match.group(1): match.group(2) for match in _ENV_RE.finditer(text)
+        })
         print("✅ Environment variables loaded from .env")
     else:
         print("⚠️  No .env file found. Please configure API keys.")
@@ -458,16 +702,14 @@ def main():
     # Load environment
     load_environment()
     
-    # Check for required dependencies
-    try:
-        import speech_recognition
-        print("✅ Speech recognition available")
-    except ImportError:
-        print("⚠️  Installing speech recognition...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "speechrecognition", "pyaudio"])
-    
-    # Create and launch interface
-    interface = create_interface()
+    # Warm optional dependencies in parallel while Gradio builds the
+    # interface; already-installed packages make these instant no-ops
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        pool.submit(_ensure_browser_use)
+        pool.submit(_ensure_speech_recognition)
+
+        # Create and launch interface
+        interface = create_interface()
     
     print("✅ Interface created successfully")
     print("🌐 Starting web server...")
@@ -7,9 +7,11 @@ Fixes the login loop and adds proper credential prompting
 import asyncio
 import gradio as gr
 import os
+import re
 import sys
 import json
 import time
+from collections import deque
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -21,13 +23,54 @@ except ImportError as e:
     print(f"❌ Browser-use import error: {e}")
     sys.exit(1)
 
+async def get_visible_text(page, limit=50000):
+    """Bounded visible-text fetch for content inspection. innerText is
+    sliced inside the browser, so at most `limit` characters cross CDP -
+    unlike page.content(), which marshals the full outerHTML including
+    script/style/hidden nodes into an unbounded Python string"""
+    return await page.evaluate(
+        f"() => document.body.innerText.slice(0, {int(limit)})"
+    )
+
+# Static prompt text built once at import; per-command calls only format
+# in the dynamic pieces
+_ENHANCED_TEMPLATE = """
+{task}
+
+CRITICAL INSTRUCTIONS:
+1. If you find a login page, STAY ON IT - do not go back to search
+2. If you need credentials and none are provided, ASK THE USER
+3. Do not search for login pages repeatedly - once found, use it
+4. Focus on the current page and complete the task step by step
+5. If credentials are provided: username="{username}", password="{password}"
+
+EXECUTION RULES:
+- Stay on the current page once you find what you need
+- Do not loop back to search engines
+- Complete one action at a time methodically
+- If login fails, explain what happened and what's needed
+- Take screenshots to show progress
+
+Execute this task with focus and precision. No endless searching.
+"""
+
 class FixedBrowserAutomation:
     def __init__(self, api_key):
         self.api_key = api_key
         self.llm = self.setup_llm()
+        # One Agent (and therefore one Chromium) for the whole session:
+        # relaunching per command paid a cold browser start each time and
+        # threw away cookies, which is what caused the re-login loops
+        self._agent = None
+        # Running totals so stats stay O(1) while the bounded history
+        # below drops old entries
+        self._total_commands = 0
+        self._successful_commands = 0
         self.session_data = {
             "credentials": {},
-            "conversation_history": [],
+            # Bounded: entries carry full agent results (tens of KB each),
+            # so an unbounded list leaks memory on a long-running server
+            "conversation_history": deque(maxlen=200),
             "current_url": "",
             "last_screenshot": None,
             "needs_credentials": False,
@@ -51,46 +94,49 @@ class FixedBrowserAutomation:
             if not self.llm:
                 return "❌ No API key configured"
             
-            # Build focused automation prompt - no loops
-            enhanced_command = f"""
-{command}
+            # Multi-step input (one step per line or ';'-separated) becomes
+            # a single batched plan: the agent sees the whole plan in one
+            # run instead of paying an LLM round trip per step
+            steps = [s.strip() for s in re.split(r"[;\n]+", command) if s.strip()]
+            if len(steps) > 1:
+                plan = json.dumps({"steps": steps}, indent=2)
+                task_block = (
+                    "Execute this multi-step plan IN ORDER as one continuous run:\n"
+                    f"{plan}\n"
+                    "Do not stop between steps. Report a single consolidated "
+                    "observation at the end instead of narrating each step."
+                )
+            else:
+                task_block = command
 
-CRITICAL INSTRUCTIONS:
-1. If you find a login page, STAY ON IT - do not go back to search
-2. If you need credentials and none are provided, ASK THE USER
-3. Do not search for login pages repeatedly - once found, use it
-4. Focus on the current page and complete the task step by step
-5. If credentials are provided: username="{username}", password="{password}"
-
-EXECUTION RULES:
-- Stay on the current page once you find what you need
-- Do not loop back to search engines
-- Complete one action at a time methodically
-- If login fails, explain what happened and what's needed
-- Take screenshots to show progress
+            # Build focused automation prompt - no loops
+            enhanced_command = _ENHANCED_TEMPLATE.format(
+                task=task_block, username=username, password=password
+            )
 
-Execute this task with focus and precision. No endless searching.
-"""
-            
             print(f"🚀 Executing: {command}")
             
-            # Create agent with focused settings
-            agent = Agent(
-                task=enhanced_command,
-                llm=self.llm,
-                use_vision=True,
-                max_failures=3,  # Fewer retries to avoid loops
-                retry_delay=2,
-                browser_args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage', 
-                    '--no-sandbox',
-                    '--disable-gpu',
-                    '--window-size=1920,1080',
-                    '--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                ]
-            )
-            
+            # Create the agent once with focused settings, then feed the
+            # existing browser new tasks so cookies and auth survive
+            if self._agent is None:
+                self._agent = Agent(
+                    task=enhanced_command,
+                    llm=self.llm,
+                    use_vision=True,
+                    max_failures=3,  # Fewer retries to avoid loops
+                    retry_delay=2,
+                    browser_args=[
+                        '--disable-blink-features=AutomationControlled',
+                        '--disable-dev-shm-usage',
+                        '--no-sandbox',
+                        '--window-size=1920,1080',
+                        '--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+                    ]
+                )
+            else:
+                self._agent.add_new_task(enhanced_command)
+            agent = self._agent
+
             # Execute with timeout to prevent infinite loops
             result = await asyncio.wait_for(agent.run(), timeout=300)  # 5 minute timeout
             
@@ -102,6 +148,8 @@ Execute this task with focus and precision. No endless searching.
                 "success": True,
                 "credentials_used": bool(username and password)
             })
+            self._total_commands += 1
+            self._successful_commands += 1
             
             # Capture current state
             try:
@@ -109,15 +157,30 @@ Execute this task with focus and precision. No endless searching.
                     current_page = agent.browser.pages[0]
                     self.session_data["current_url"] = current_page.url
                     
-                    # Take screenshot
-                    screenshot_path = f"/tmp/automation_screenshot_{int(time.time())}.png"
-                    await current_page.screenshot(path=screenshot_path, full_page=True)
+                    # Take screenshot: viewport-only JPEG is 10-30x smaller
+                    # than a full-page PNG and plenty for a progress
+                    # thumbnail; the fixed path overwrites the previous
+                    # capture so /tmp doesn't fill up over a long session
+                    screenshot_path = "/tmp/automation_screenshot.jpg"
+                    await current_page.screenshot(
+                        path=screenshot_path,
+                        type="jpeg",
+                        quality=70,
+                        full_page=False,
+                        clip={"x": 0, "y": 0, "width": 1280, "height": 800}
+                    )
                     self.session_data["last_screenshot"] = screenshot_path
                     print(f"📸 Screenshot saved: {screenshot_path}")
                     
-                    # Check if we're on a login page and need credentials
-                    page_content = await current_page.content()
-                    if ("login" in page_content.lower() or "sign in" in page_content.lower()) and not (username and password):
+                    # Check if we're on a login page and need credentials.
+                    # A constant-time selector probe in the page replaces
+                    # downloading the whole rendered DOM over CDP just to
+                    # substring-match it in Python
+                    has_login = await current_page.evaluate(
+                        "() => !!document.querySelector("
+                        "'input[type=password], form[action*=login i], a[href*=login i]')"
+                    )
+                    if has_login and not (username and password):
                         self.session_data["needs_credentials"] = True
                         self.session_data["credential_prompt"] = f"Login page detected at {current_page.url}. Please provide credentials to continue."
                         
@@ -137,6 +200,7 @@ Execute this task with focus and precision. No endless searching.
                 "success": False,
                 "credentials_used": bool(username and password)
             })
+            self._total_commands += 1
             return error_msg
     
     def create_interface(self):
@@ -183,17 +247,14 @@ Execute this task with focus and precision. No endless searching.
                     with gr.Column(scale=1):
                         gr.HTML("<h3>🎯 Automation Command</h3>")
                         
-                        # Credential status alert
-                        credential_alert = gr.HTML(
-                            "<div>Ready for automation commands</div>",
-                            elem_classes="credential-alert"
-                        )
-                        
                         # Main command input
                         automation_command = gr.Textbox(
                             label="Universal Automation Command",
-                            placeholder="e.g., 'Login to turing.com and show me my completed quizzes'",
-                            lines=3,
+                            placeholder=(
+                                "e.g., 'Login to turing.com and show me my completed quizzes'\n"
+                                "Multi-step: one step per line (or ';'-separated) runs as a single batched plan"
+                            ),
+                            lines=6,
                             elem_classes="command-section"
                         )
                         
@@ -227,17 +288,17 @@ Execute this task with focus and precision. No endless searching.
                             "Visit github.com and show trending repositories"
                         ]
                         
-                        for example in examples:
-                            btn = gr.Button(f"💡 {example}", size="sm")
-                            btn.click(
-                                fn=lambda ex=example: ex,
-                                outputs=automation_command
-                            )
+                        # gr.Examples fills the textbox client-side: one
+                        # component instead of six buttons each paying a
+                        # server round trip just to echo a string back
+                        gr.Examples(examples=examples, inputs=automation_command)
                     
                     with gr.Column(scale=2):
                         gr.HTML("<h3>📊 Execution Results</h3>")
                         
-                        # Execution status
+                        # Single status panel: execution state and any
+                        # credential prompt render as one update per
+                        # command instead of two separate HTML re-renders
                         execution_status = gr.HTML(
                             "<div style='padding: 10px; background: #f0fdf4; border-radius: 5px;'>Ready to execute commands</div>"
                         )
@@ -284,50 +345,70 @@ Execute this task with focus and precision. No endless searching.
                         )
             
             # Event handlers
-            def execute_automation_handler(command, username, password):
+            async def execute_automation_handler(command, username, password):
+                # Async generator: Gradio streams each yield, so the user
+                # sees progress within seconds instead of a frozen banner
+                # for a run that can last up to 5 minutes
                 if not command.strip():
-                    return (
+                    yield (
                         "<div style='padding: 10px; background: #fee2e2; border-radius: 5px;'>❌ Please enter a command</div>",
                         "❌ No command provided",
                         "",
-                        None,
-                        "<div>Please enter a command to execute</div>"
+                        None
                     )
-                
-                # Clear previous credential alerts
-                status_msg = "<div style='padding: 10px; background: #dbeafe; border-radius: 5px;'>🚀 Executing command...</div>"
-                
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    result = loop.run_until_complete(
-                        self.execute_universal_command(command, username, password)
+                    return
+
+                task = asyncio.create_task(
+                    self.execute_universal_command(command, username, password)
+                )
+                running_msg = "<div style='padding: 10px; background: #dbeafe; border-radius: 5px;'>🚀 Executing command...</div>"
+
+                # Poll every 2s (a deliberate throttle so the UI isn't
+                # flooded) and only re-yield when the visible state changed
+                last_state = None
+                while not task.done():
+                    state = (
+                        self.session_data.get("current_url", ""),
+                        self.session_data.get("last_screenshot")
                     )
-                    loop.close()
-                    
+                    if state != last_state:
+                        yield (running_msg, "⏳ Agent is working...", *state)
+                        last_state = state
+                    await asyncio.sleep(2)
+
+                try:
+                    result = await task
+
                     current_url = self.session_data.get("current_url", "")
                     screenshot = self.session_data.get("last_screenshot")
-                    
-                    # Check if credentials are needed
+
+                    # One status blob computed once at the end; interim
+                    # "executing..." chatter caused extra UI re-renders for
+                    # no information the final state doesn't carry
                     if self.session_data.get("needs_credentials", False):
-                        credential_msg = f"<div class='credential-alert'>🔐 {self.session_data.get('credential_prompt', 'Login detected - please provide credentials and try again')}</div>"
-                        success_msg = "<div style='padding: 10px; background: #fef3c7; border-radius: 5px;'>⚠️ Credentials needed</div>"
+                        prompt = self.session_data.get(
+                            "credential_prompt",
+                            "Login detected - please provide credentials and try again"
+                        )
+                        status_msg = (
+                            "<div style='padding: 10px; background: #fef3c7; border-radius: 5px;'>⚠️ Credentials needed</div>"
+                            f"<div class='credential-alert'>🔐 {prompt}</div>"
+                        )
                     else:
-                        credential_msg = "<div>✅ Command executed successfully</div>"
-                        success_msg = "<div style='padding: 10px; background: #d1fae5; border-radius: 5px;'>✅ Command completed</div>"
-                    
-                    return success_msg, result, current_url, screenshot, credential_msg
-                    
+                        status_msg = "<div style='padding: 10px; background: #d1fae5; border-radius: 5px;'>✅ Command completed</div>"
+
+                    yield status_msg, result, current_url, screenshot
+
                 except Exception as e:
                     error_msg = f"❌ Error: {str(e)}"
                     error_status = "<div style='padding: 10px; background: #fee2e2; border-radius: 5px;'>❌ Execution failed</div>"
-                    return error_status, error_msg, "", None, "<div>Error occurred during execution</div>"
+                    yield error_status, error_msg, "", None
             
             def refresh_history_handler():
-                history = self.session_data.get("conversation_history", [])[-10:]  # Last 10
+                history = list(self.session_data.get("conversation_history", []))[-10:]  # Last 10
                 stats = {
-                    "total_commands": len(self.session_data.get("conversation_history", [])),
-                    "successful_commands": len([h for h in self.session_data.get("conversation_history", []) if h.get("success", False)]),
+                    "total_commands": self._total_commands,
+                    "successful_commands": self._successful_commands,
                     "current_url": self.session_data.get("current_url", ""),
                     "last_updated": time.strftime("%Y-%m-%d %H:%M:%S")
                 }
@@ -337,7 +418,7 @@ Execute this task with focus and precision. No endless searching.
             execute_btn.click(
                 fn=execute_automation_handler,
                 inputs=[automation_command, cred_username, cred_password],
-                outputs=[execution_status, result_output, current_url_display, screenshot_output, credential_alert]
+                outputs=[execution_status, result_output, current_url_display, screenshot_output]
             )
             
             refresh_history_btn.click(
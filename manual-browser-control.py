@@ -6,24 +6,65 @@ Provides step-by-step browser control without requiring AI/LLM
 
 import asyncio
 import gradio as gr
+import re
 from playwright.async_api import async_playwright
 from typing import Optional, Dict, Any
 import json
 
+# Analytics/ad beacons that shouldn't count toward "page is ready":
+# waiting on them is what stretches default load waits to 10-30s
+_TRACKER_RE = re.compile(
+    r"doubleclick|google-analytics|googletagmanager|hotjar|segment|facebook\.net|tracking",
+    re.IGNORECASE,
+)
+
 class ManualBrowserController:
     def __init__(self):
         self.browser = None
         self.context = None
         self.page = None
         self.playwright = None
-        
-    async def start_browser(self, headless: bool = False):
+        self._pending_requests = set()
+        self.fast_mode = False
+
+    async def start_browser(self, headless: bool = False, fast_mode: bool = False):
         """Start the browser session"""
         try:
+            self.fast_mode = fast_mode
             self.playwright = await async_playwright().start()
             self.browser = await self.playwright.chromium.launch(headless=headless)
             self.context = await self.browser.new_context()
+
+            # Tracker requests are always dropped; fast mode also skips
+            # stylesheets/fonts/images/media, which manual control never
+            # needs and which dominate bytes-over-the-wire on most sites
+            async def _router(route):
+                request = route.request
+                if _TRACKER_RE.search(request.url):
+                    await route.abort()
+                elif self.fast_mode and request.resource_type in (
+                    "stylesheet", "font", "image", "media"
+                ):
+                    await route.abort()
+                else:
+                    await route.continue_()
+
+            await self.context.route("**/*", _router)
             self.page = await self.context.new_page()
+
+            # Track in-flight requests (minus trackers) so navigation can
+            # use adaptive network-idle instead of the default full 'load'
+            def _track_request(request):
+                if not _TRACKER_RE.search(request.url):
+                    self._pending_requests.add(request)
+
+            def _untrack_request(request):
+                self._pending_requests.discard(request)
+
+            self.page.on("request", _track_request)
+            self.page.on("requestfinished", _untrack_request)
+            self.page.on("requestfailed", _untrack_request)
+
             return "Browser started successfully!"
         except Exception as e:
             return f"Error starting browser: {e}"
@@ -34,13 +75,33 @@ class ManualBrowserController:
             return "Browser not started. Please start browser first."
         
         try:
-            await self.page.goto(url)
+            # domcontentloaded + adaptive idle returns as soon as the real
+            # page traffic settles, rather than waiting for every analytics
+            # beacon the default 'load' condition counts
+            await self.page.goto(url, wait_until="domcontentloaded", timeout=15000)
+            await self._wait_for_quiet_network()
             title = await self.page.title()
             current_url = self.page.url
             return f"Navigated to: {current_url}\nPage title: {title}"
         except Exception as e:
             return f"Error navigating to {url}: {e}"
     
+    async def _wait_for_quiet_network(self, idle_ms: int = 500, timeout_s: float = 5.0):
+        """Wait until no non-tracker requests have been in flight for
+        idle_ms, capped at timeout_s so a chatty page can't stall us"""
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout_s
+        quiet_since = None
+        while loop.time() < deadline:
+            if not self._pending_requests:
+                if quiet_since is None:
+                    quiet_since = loop.time()
+                elif (loop.time() - quiet_since) * 1000 >= idle_ms:
+                    return
+            else:
+                quiet_since = None
+            await asyncio.sleep(0.05)
+
     async def click_element(self, selector: str):
         """Click an element by CSS selector"""
         if not self.page:
@@ -69,23 +130,36 @@ class ManualBrowserController:
             return "Browser not started."
         
         try:
-            title = await self.page.title()
             url = self.page.url
-            
-            # Get visible elements
-            buttons = await self.page.locator('button').all_text_contents()
-            links = await self.page.locator('a').all_text_contents()
-            inputs = await self.page.locator('input').count()
-            
+
+            # One evaluate gathers everything in a single CDP round trip,
+            # and slices in the browser so a long listing page ships a few
+            # strings instead of every text node
+            page_data = await self.page.evaluate(
+                """() => {
+                    const buttons = document.querySelectorAll('button');
+                    const links = document.querySelectorAll('a');
+                    const text = els => [...els].slice(0, 5).map(e => e.innerText.trim());
+                    return {
+                        title: document.title,
+                        buttonCount: buttons.length,
+                        linkCount: links.length,
+                        inputCount: document.querySelectorAll('input').length,
+                        buttonText: text(buttons),
+                        linkText: text(links)
+                    };
+                }"""
+            )
+
             info = f"""
 Current URL: {url}
-Page Title: {title}
-Buttons found: {len(buttons)}
-Links found: {len(links)}
-Input fields: {inputs}
+Page Title: {page_data['title']}
+Buttons found: {page_data['buttonCount']}
+Links found: {page_data['linkCount']}
+Input fields: {page_data['inputCount']}
 
-First 5 buttons: {buttons[:5]}
-First 5 links: {links[:5]}
+First 5 buttons: {page_data['buttonText']}
+First 5 links: {page_data['linkText']}
 """
             return info
         except Exception as e:
@@ -129,8 +203,8 @@ First 5 links: {links[:5]}
 controller = ManualBrowserController()
 
 # Gradio interface functions
-async def start_browser_ui(headless):
-    return await controller.start_browser(headless)
+async def start_browser_ui(headless, fast_mode):
+    return await controller.start_browser(headless, fast_mode)
 
 async def navigate_ui(url):
     return await controller.navigate_to_url(url)
@@ -164,6 +238,9 @@ def create_interface():
             with gr.Row():
                 start_btn = gr.Button("Start Browser")
                 headless_check = gr.Checkbox(label="Headless Mode", value=False)
+                fast_check = gr.Checkbox(
+                    label="Fast Mode (block images/CSS/fonts)", value=False
+                )
                 close_btn = gr.Button("Close Browser")
             
             start_output = gr.Textbox(label="Status", lines=2)
@@ -206,7 +283,7 @@ def create_interface():
             js_output = gr.Textbox(label="JavaScript Result", lines=5)
         
         # Event handlers
-        start_btn.click(start_browser_ui, inputs=[headless_check], outputs=[start_output])
+        start_btn.click(start_browser_ui, inputs=[headless_check, fast_check], outputs=[start_output])
         nav_btn.click(navigate_ui, inputs=[url_input], outputs=[nav_output])
         click_btn.click(click_ui, inputs=[selector_input], outputs=[click_output])
         fill_btn.click(fill_ui, inputs=[fill_selector, fill_text], outputs=[fill_output])
@@ -33,6 +33,43 @@ class AutomationAction:
     parameters: Optional[Dict[str, Any]] = None
     description: Optional[str] = None
 
+# Compound-command separators fused into a single alternation so splitting is
+# one pass over the command instead of one re.split per separator. Order
+# matters: longer separators come first so "and then" wins over "then"
+_COMPOUND_SPLIT_RE = re.compile(
+    r'\s+and\s+then\s+'
+    r'|\s*,\s*and\s+then\s+'
+    r'|\s+then\s+'
+    r'|\s*,\s*then\s+'
+    r'|\s*,\s*and\s+'
+    r'|\s*;\s*'
+    r'|\s+after\s+that\s+'
+    r'|\s+next\s+'
+    r'|\s+afterwards\s+'
+    r'|\s*,\s*(?=(?:find|see|take|click|go|navigate|login|search|fill|submit|wait|scroll))'
+    r'|\s+and\s+(?=(?:find|see|take|click|go|navigate|login|search|fill|submit|wait|scroll))'
+)
+
+# Complex-phrase patterns compiled once at import instead of per call
+_AUTH_PATTERNS = tuple(re.compile(p) for p in (
+    r"login\s+with\s+(.+?)\s+to\s+(?:the\s+)?(.+)",
+    r"sign\s+in\s+(?:with\s+)?(.+?)\s+(?:to\s+)?(?:the\s+)?(.+)",
+    r"authenticate\s+(?:with\s+)?(.+?)\s+(?:for\s+)?(.+)"
+))
+
+_FIND_PATTERNS = tuple(re.compile(p) for p in (
+    r"find\s+(?:my\s+)?(.+?)(?:\s*,|\s+and|\s*$)",
+    r"look\s+for\s+(?:my\s+)?(.+?)(?:\s*,|\s+and|\s*$)",
+    r"locate\s+(?:my\s+)?(.+?)(?:\s*,|\s+and|\s*$)",
+    r"see\s+(?:what\s+)?(?:i\s+)?(.+?)(?:\s*,|\s+and|\s*$)"
+))
+
+_COMPLETION_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?:take|complete|do|finish)\s+(?:the\s+)?(.+?)\s+(?:and\s+)?(?:pass\s+them\s+)?(\d+%|\d+\s*percent|100%|all)?",
+    r"(?:pass|complete)\s+(.+?)\s+(?:at\s+)?(\d+%|\d+\s*percent|100%)?",
+    r"(?:we\s+need\s+to\s+)?(?:take|do|complete)\s+(.+?)\s+(?:all\s+)?(?:please)?"
+))
+
 class NaturalLanguageProcessor:
     """Processes natural language commands and converts them to automation actions"""
     
@@ -40,9 +77,9 @@ class NaturalLanguageProcessor:
         self.action_patterns = self._initialize_patterns()
         self.context_keywords = self._initialize_context_keywords()
     
-    def _initialize_patterns(self) -> Dict[ActionType, List[str]]:
-        """Initialize regex patterns for different action types"""
-        return {
+    def _initialize_patterns(self) -> Dict[ActionType, List[re.Pattern]]:
+        """Initialize regex patterns for different action types (compiled once)"""
+        raw_patterns = {
             ActionType.NAVIGATE: [
                 r"(?:go to|navigate to|visit|open)\s+(.+)",
                 r"(?:load|browse to)\s+(.+)",
@@ -109,7 +146,12 @@ class NaturalLanguageProcessor:
                 r"(?:we\s+need\s+to\s+)?(?:accomplish|achieve)\s+(.+)"
             ]
         }
-    
+        # Compile once here so process_command never re-parses pattern strings
+        return {
+            action_type: [re.compile(p, re.IGNORECASE) for p in patterns]
+            for action_type, patterns in raw_patterns.items()
+        }
+
     def _initialize_context_keywords(self) -> Dict[str, List[str]]:
         """Initialize context keywords for better understanding"""
         return {
@@ -163,28 +205,8 @@ class NaturalLanguageProcessor:
     
     def _split_compound_command_enhanced(self, command: str) -> List[str]:
         """Enhanced compound command splitting with better context awareness"""
-        # More sophisticated separators that preserve context
-        separators = [
-            r'\s+and\s+then\s+',
-            r'\s+then\s+',
-            r'\s*,\s*then\s+',
-            r'\s*,\s*and\s+then\s+',
-            r'\s*,\s*and\s+',
-            r'\s*;\s*',
-            r'\s+after\s+that\s+',
-            r'\s+next\s+',
-            r'\s+afterwards\s+',
-            r'\s*,\s*(?=(?:find|see|take|click|go|navigate|login|search|fill|submit|wait|scroll))',
-            r'\s+and\s+(?=(?:find|see|take|click|go|navigate|login|search|fill|submit|wait|scroll))'
-        ]
-
-        commands = [command]
-        for separator in separators:
-            new_commands = []
-            for cmd in commands:
-                split_parts = re.split(separator, cmd)
-                new_commands.extend(split_parts)
-            commands = new_commands
+        # Single pass over the fused separator alternation
+        commands = _COMPOUND_SPLIT_RE.split(command)
 
         # Clean and filter parts
         cleaned_commands = []
@@ -213,14 +235,8 @@ class NaturalLanguageProcessor:
         """Parse complex phrases that don't match simple patterns"""
 
         # Handle authentication/login patterns
-        auth_patterns = [
-            r"login\s+with\s+(.+?)\s+to\s+(?:the\s+)?(.+)",
-            r"sign\s+in\s+(?:with\s+)?(.+?)\s+(?:to\s+)?(?:the\s+)?(.+)",
-            r"authenticate\s+(?:with\s+)?(.+?)\s+(?:for\s+)?(.+)"
-        ]
-
-        for pattern in auth_patterns:
-            match = re.search(pattern, command)
+        for pattern in _AUTH_PATTERNS:
+            match = pattern.search(command)
             if match:
                 method = match.group(1).strip()
                 target = match.group(2).strip() if len(match.groups()) > 1 else ""
@@ -232,15 +248,8 @@ class NaturalLanguageProcessor:
                 )
 
         # Handle finding/searching patterns
-        find_patterns = [
-            r"find\s+(?:my\s+)?(.+?)(?:\s*,|\s+and|\s*$)",
-            r"look\s+for\s+(?:my\s+)?(.+?)(?:\s*,|\s+and|\s*$)",
-            r"locate\s+(?:my\s+)?(.+?)(?:\s*,|\s+and|\s*$)",
-            r"see\s+(?:what\s+)?(?:i\s+)?(.+?)(?:\s*,|\s+and|\s*$)"
-        ]
-
-        for pattern in find_patterns:
-            match = re.search(pattern, command)
+        for pattern in _FIND_PATTERNS:
+            match = pattern.search(command)
             if match:
                 target = match.group(1).strip()
                 return AutomationAction(
@@ -250,14 +259,8 @@ class NaturalLanguageProcessor:
                 )
 
         # Handle completion/achievement patterns
-        completion_patterns = [
-            r"(?:take|complete|do|finish)\s+(?:the\s+)?(.+?)\s+(?:and\s+)?(?:pass\s+them\s+)?(\d+%|\d+\s*percent|100%|all)?",
-            r"(?:pass|complete)\s+(.+?)\s+(?:at\s+)?(\d+%|\d+\s*percent|100%)?",
-            r"(?:we\s+need\s+to\s+)?(?:take|do|complete)\s+(.+?)\s+(?:all\s+)?(?:please)?"
-        ]
-
-        for pattern in completion_patterns:
-            match = re.search(pattern, command)
+        for pattern in _COMPLETION_PATTERNS:
+            match = pattern.search(command)
             if match:
                 target = match.group(1).strip()
                 score = match.group(2) if len(match.groups()) > 1 and match.group(2) else "100%"
@@ -315,7 +318,7 @@ class NaturalLanguageProcessor:
         # Try to match against each action type
         for action_type, patterns in self.action_patterns.items():
             for pattern in patterns:
-                match = re.search(pattern, command, re.IGNORECASE)
+                match = pattern.search(command)
                 if match:
                     return self._create_action(action_type, match, command)
         
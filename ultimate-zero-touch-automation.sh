@@ -167,6 +167,7 @@ Ultimate Browser Automation Interface
 import asyncio
 import gradio as gr
 import os
+import re
 import sys
 import json
 import time
@@ -184,6 +185,9 @@ except ImportError as e:
     print(f"❌ Browser-use import error: {e}")
     sys.exit(1)
 
+# Case-insensitive scan in C, without lowercasing a copy of the whole DOM
+_LOGIN_RE = re.compile(r"login|sign in", re.IGNORECASE)
+
 class UltimateBrowserAutomation:
     def __init__(self, api_key, port):
         self.api_key = api_key
@@ -319,7 +323,7 @@ Execute efficiently and stop when done.
                     
                     # Check for login requirements
                     page_content = await current_page.content()
-                    if ("login" in page_content.lower() or "sign in" in page_content.lower()) and not (username and password):
+                    if _LOGIN_RE.search(page_content) and not (username and password):
                         self.session_data["needs_credentials"] = True
                         self.session_data["credential_prompt"] = f"Login detected at {current_page.url}"
                         